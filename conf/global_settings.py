@@ -432,6 +432,7 @@ CACHES = {
 }
 CACHE_MIDDLEWARE_KEY_PREFIX = ''
 CACHE_MIDDLEWARE_SECONDS = 600
+CACHE_MIDDLEWARE_STALE_SECONDS = 0
 CACHE_MIDDLEWARE_ALIAS = 'default'
 
 ##################
@@ -48,6 +48,17 @@ def pagination(cl):
     """
     paginator, page_num = cl.paginator, cl.page_num
 
+    if cl.uses_cursor:
+        # 游标分页只链接到上一页和下一页。
+        page = cl.page
+        return {
+            'cl': cl,
+            'uses_cursor': True,
+            'pagination_required': cl.multi_page,
+            'previous_url': page.has_previous() and cl.get_query_string({PAGE_VAR: page.previous_cursor()}),
+            'next_url': page.has_next() and cl.get_query_string({PAGE_VAR: page.next_cursor()}),
+        }
+
     pagination_required = (not cl.show_all or not cl.can_show_all) and cl.multi_page
     if not pagination_required:
         page_range = []
@@ -429,7 +440,7 @@ def search_form(cl):
     """
     return {
         'cl': cl,
-        'show_result_count': cl.result_count != cl.full_result_count,
+        'show_result_count': not cl.uses_cursor and cl.result_count != cl.full_result_count,
         'search_var': SEARCH_VAR
     }
 
@@ -234,6 +234,8 @@ class NestedObjects(Collector):
         """
         return False
 
+    can_fast_delete_cascade = can_fast_delete
+
 
 def model_format_dict(obj):
     """
@@ -15,7 +15,7 @@ from django.contrib.admin.utils import (
 from django.core.exceptions import (
     FieldDoesNotExist, ImproperlyConfigured, SuspiciousOperation,
 )
-from django.core.paginator import InvalidPage
+from django.core.paginator import CursorPaginator, InvalidPage, Paginator
 from django.db import models
 from django.db.models.expressions import Combinable, F, OrderBy
 from django.urls import reverse
@@ -36,6 +36,9 @@ IGNORED_PARAMS = (
 
 
 class ChangeList:
+    # 是否使用游标分页，由get_results()设置。
+    uses_cursor = False
+
     def __init__(self, request, model, list_display, list_display_links,
                  list_filter, date_hierarchy, search_fields, list_select_related,
                  list_per_page, list_max_show_all, list_editable, model_admin, sortable_by):
@@ -192,7 +195,28 @@ class ChangeList:
         return '?%s' % urlencode(sorted(p.items()))
 
     def get_results(self, request):
-        paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        try:
+            paginator = self.model_admin.get_paginator(request, self.queryset, self.list_per_page)
+        except (FieldDoesNotExist, ValueError):
+            # CursorPaginator不支持按表达式或注解排序，此时退回到普通分页。
+            paginator = Paginator(self.queryset, self.list_per_page)
+        self.uses_cursor = isinstance(paginator, CursorPaginator)
+        if self.uses_cursor:
+            # 游标分页不统计对象数量：页面由PAGE_VAR中的游标标识，结果数量是此页面上的对象数量。
+            try:
+                self.page = paginator.page(request.GET.get(PAGE_VAR))
+            except InvalidPage:
+                raise IncorrectLookupParameters
+            self.result_count = len(self.page)
+            self.show_full_result_count = False
+            self.show_admin_actions = True
+            self.full_result_count = None
+            self.result_list = self.page.object_list
+            self.can_show_all = False
+            self.multi_page = self.page.has_other_pages()
+            self.paginator = paginator
+            return
+
         # 应用管理过滤器获取对象数量。
         result_count = paginator.count
 
@@ -78,3 +78,5 @@ class NoFastDeleteCollector(Collector):
         Always load related objects to display them when showing confirmation.
         """
         return False
+
+    can_fast_delete_cascade = can_fast_delete
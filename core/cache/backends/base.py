@@ -47,6 +47,18 @@ def get_key_func(key_func):
     return default_key_func
 
 
+def get_instance(cls):
+    """
+    Return an instance of cls, which can be a class or its dotted path, or
+    None if cls is None.
+    """
+    if cls is None:
+        return None
+    if isinstance(cls, str):
+        cls = import_string(cls)
+    return cls()
+
+
 class BaseCache:
     def __init__(self, params):
         timeout = params.get('timeout', params.get('TIMEOUT', 300))
@@ -74,6 +86,15 @@ class BaseCache:
         self.version = params.get('VERSION', 1)
         self.key_func = get_key_func(params.get('KEY_FUNCTION'))
 
+        self._serializer = get_instance(
+            params.get('SERIALIZER', 'django.core.cache.serializers.PickleSerializer')
+        )
+        self._compressor = get_instance(params.get('COMPRESSOR'))
+        try:
+            self._compress_min_length = int(params.get('COMPRESS_MIN_LENGTH', 1024))
+        except (ValueError, TypeError):
+            self._compress_min_length = 1024
+
     def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
         """
         Return the timeout value usable by this backend based upon the provided
@@ -86,6 +107,31 @@ class BaseCache:
             timeout = -1
         return None if timeout is None else time.time() + timeout
 
+    def serialize(self, value):
+        """
+        Return value converted to bytes with the cache's serializer. If the
+        cache has a compressor, prefix the bytes with a flag telling whether
+        they're compressed, which they are if they're at least
+        COMPRESS_MIN_LENGTH long.
+        """
+        data = self._serializer.dumps(value)
+        if self._compressor is None:
+            return data
+        if len(data) >= self._compress_min_length:
+            return b'\x01' + self._compressor.compress(data)
+        return b'\x00' + data
+
+    def deserialize(self, data):
+        """Return the value serialize() converted to data."""
+        if self._compressor is not None:
+            flag = data[:1]
+            if flag == b'\x01':
+                data = self._compressor.decompress(data[1:])
+            elif flag == b'\x00':
+                data = data[1:]
+            # Otherwise the value was stored without a compressor.
+        return self._serializer.loads(data)
+
     def make_key(self, key, version=None):
         """
         Construct the key used by all other methods. By default, use the
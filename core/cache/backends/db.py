@@ -1,6 +1,5 @@
 "Database cache backend."
 import base64
-import pickle
 from datetime import datetime
 
 from django.conf import settings
@@ -46,30 +45,64 @@ class DatabaseCache(BaseDatabaseCache):
     # conversion and adaptation infrastructure is then used to avoid comparing
     # aware and naive datetimes accidentally.
 
+    def __init__(self, table, params):
+        super().__init__(table, params)
+        options = params.get('OPTIONS', {})
+        # Counting the entries to decide whether to cull is only done every
+        # CULL_CHECK_INTERVAL writes made through this instance.
+        try:
+            self._cull_check_interval = int(options.get('CULL_CHECK_INTERVAL', 10))
+        except (ValueError, TypeError):
+            self._cull_check_interval = 10
+        self._writes_since_cull_check = self._cull_check_interval
+
     def get(self, key, default=None, version=None):
-        key = self.make_key(key, version=version)
-        self.validate_key(key)
+        return self.get_many([key], version).get(key, default)
+
+    def get_many(self, keys, version=None):
+        key_map = {self.make_key(key, version=version): key for key in keys}
+        for key in key_map:
+            self.validate_key(key)
+        if not key_map:
+            return {}
+
         db = router.db_for_read(self.cache_model_class)
         connection = connections[db]
         quote_name = connection.ops.quote_name
         table = quote_name(self._table)
 
+        rows = []
+        cache_keys = list(key_map)
+        batch_size = connection.ops.bulk_batch_size(['cache_key'], cache_keys)
         with connection.cursor() as cursor:
-            cursor.execute(
-                'SELECT %s, %s, %s FROM %s WHERE %s = %%s' % (
-                    quote_name('cache_key'),
-                    quote_name('value'),
-                    quote_name('expires'),
-                    table,
-                    quote_name('cache_key'),
-                ),
-                [key]
-            )
-            row = cursor.fetchone()
-        if row is None:
-            return default
+            for i in range(0, len(cache_keys), batch_size):
+                batch = cache_keys[i:i + batch_size]
+                cursor.execute(
+                    'SELECT %s, %s, %s FROM %s WHERE %s IN (%s)' % (
+                        quote_name('cache_key'),
+                        quote_name('value'),
+                        quote_name('expires'),
+                        table,
+                        quote_name('cache_key'),
+                        ', '.join(['%s'] * len(batch)),
+                    ),
+                    batch
+                )
+                rows.extend(cursor.fetchall())
+
+        result = {}
+        expired_keys = []
+        now = timezone.now()
+        for key, value, expires in rows:
+            if self._convert_expires(connection, expires) < now:
+                expired_keys.append(key)
+            else:
+                value = connection.ops.process_clob(value)
+                result[key_map[key]] = self.deserialize(base64.b64decode(value.encode()))
+        self._base_delete_many(expired_keys)
+        return result
 
-        expires = row[2]
+    def _convert_expires(self, connection, expires):
         expression = models.Expression(output_field=models.DateTimeField())
         for converter in (connection.ops.get_db_converters(expression) +
                           expression.get_db_converters(connection)):
@@ -77,22 +110,7 @@ class DatabaseCache(BaseDatabaseCache):
                 expires = converter(expires, expression, connection, {})
             else:
                 expires = converter(expires, expression, connection)
-
-        if expires < timezone.now():
-            db = router.db_for_write(self.cache_model_class)
-            connection = connections[db]
-            with connection.cursor() as cursor:
-                cursor.execute(
-                    'DELETE FROM %s WHERE %s = %%s' % (
-                        table,
-                        quote_name('cache_key'),
-                    ),
-                    [key]
-                )
-            return default
-
-        value = connection.ops.process_clob(row[1])
-        return pickle.loads(base64.b64decode(value.encode()))
+        return expires
 
     def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
@@ -109,6 +127,58 @@ class DatabaseCache(BaseDatabaseCache):
         self.validate_key(key)
         return self._base_set('touch', key, None, timeout)
 
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        """
+        Set all the keys with one query per batch of keys on databases that
+        support upserts, and with one set() per key on others.
+        """
+        rows = []
+        for key, value in data.items():
+            cache_key = self.make_key(key, version=version)
+            self.validate_key(cache_key)
+            rows.append((cache_key, value))
+        if not rows:
+            return []
+
+        db = router.db_for_write(self.cache_model_class)
+        connection = connections[db]
+        if connection.ops.cache_upsert_sql(1) is None:
+            return super().set_many(data, timeout, version)
+        table = connection.ops.quote_name(self._table)
+
+        exp = connection.ops.adapt_datetimefield_value(
+            self._get_expires(self.get_backend_timeout(timeout))
+        )
+        with connection.cursor() as cursor:
+            now = timezone.now().replace(microsecond=0)
+            self._cull_if_needed(db, cursor, now, len(rows))
+            batch_size = connection.ops.bulk_batch_size(['cache_key', 'value', 'expires'], rows)
+            try:
+                with transaction.atomic(using=db):
+                    for i in range(0, len(rows), batch_size):
+                        batch = rows[i:i + batch_size]
+                        params = []
+                        for cache_key, value in batch:
+                            params.extend((cache_key, self._encode_value(value), exp))
+                        cursor.execute(connection.ops.cache_upsert_sql(len(batch)) % table, params)
+            except DatabaseError:
+                return list(data)
+        return []
+
+    def _get_expires(self, timeout):
+        if timeout is None:
+            exp = datetime.max
+        elif settings.USE_TZ:
+            exp = datetime.utcfromtimestamp(timeout)
+        else:
+            exp = datetime.fromtimestamp(timeout)
+        return exp.replace(microsecond=0)
+
+    def _encode_value(self, value):
+        # The DB column is expecting a string, so make sure the value is a
+        # string, not bytes. Refs #19274.
+        return base64.b64encode(self.serialize(value)).decode('latin1')
+
     def _base_set(self, mode, key, value, timeout=DEFAULT_TIMEOUT):
         timeout = self.get_backend_timeout(timeout)
         db = router.db_for_write(self.cache_model_class)
@@ -117,23 +187,11 @@ class DatabaseCache(BaseDatabaseCache):
         table = quote_name(self._table)
 
         with connection.cursor() as cursor:
-            cursor.execute("SELECT COUNT(*) FROM %s" % table)
-            num = cursor.fetchone()[0]
             now = timezone.now()
             now = now.replace(microsecond=0)
-            if timeout is None:
-                exp = datetime.max
-            elif settings.USE_TZ:
-                exp = datetime.utcfromtimestamp(timeout)
-            else:
-                exp = datetime.fromtimestamp(timeout)
-            exp = exp.replace(microsecond=0)
-            if num > self._max_entries:
-                self._cull(db, cursor, now)
-            pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
-            # The DB column is expecting a string, so make sure the value is a
-            # string, not bytes. Refs #19274.
-            b64encoded = base64.b64encode(pickled).decode('latin1')
+            exp = self._get_expires(timeout)
+            self._cull_if_needed(db, cursor, now)
+            b64encoded = self._encode_value(value)
             try:
                 # Note: typecasting for datetimes is needed by some 3rd party
                 # database backends. All core backends work without typecasting,
@@ -152,14 +210,7 @@ class DatabaseCache(BaseDatabaseCache):
                     result = cursor.fetchone()
 
                     if result:
-                        current_expires = result[1]
-                        expression = models.Expression(output_field=models.DateTimeField())
-                        for converter in (connection.ops.get_db_converters(expression) +
-                                          expression.get_db_converters(connection)):
-                            if func_supports_parameter(converter, 'context'):  # RemovedInDjango30Warning
-                                current_expires = converter(current_expires, expression, connection, {})
-                            else:
-                                current_expires = converter(current_expires, expression, connection)
+                        current_expires = self._convert_expires(connection, result[1])
 
                     exp = connection.ops.adapt_datetimefield_value(exp)
                     if result and mode == 'touch':
@@ -200,15 +251,37 @@ class DatabaseCache(BaseDatabaseCache):
                 return True
 
     def delete(self, key, version=None):
-        key = self.make_key(key, version=version)
-        self.validate_key(key)
+        self.delete_many([key], version)
+
+    def delete_many(self, keys, version=None):
+        key_list = []
+        for key in keys:
+            key = self.make_key(key, version=version)
+            self.validate_key(key)
+            key_list.append(key)
+        self._base_delete_many(key_list)
+
+    def _base_delete_many(self, keys):
+        if not keys:
+            return
 
         db = router.db_for_write(self.cache_model_class)
         connection = connections[db]
-        table = connection.ops.quote_name(self._table)
+        quote_name = connection.ops.quote_name
+        table = quote_name(self._table)
 
+        batch_size = connection.ops.bulk_batch_size(['cache_key'], keys)
         with connection.cursor() as cursor:
-            cursor.execute("DELETE FROM %s WHERE cache_key = %%s" % table, [key])
+            for i in range(0, len(keys), batch_size):
+                batch = keys[i:i + batch_size]
+                cursor.execute(
+                    'DELETE FROM %s WHERE %s IN (%s)' % (
+                        table,
+                        quote_name('cache_key'),
+                        ', '.join(['%s'] * len(batch)),
+                    ),
+                    batch
+                )
 
     def has_key(self, key, version=None):
         key = self.make_key(key, version=version)
@@ -235,6 +308,20 @@ class DatabaseCache(BaseDatabaseCache):
             )
             return cursor.fetchone() is not None
 
+    def _cull_if_needed(self, db, cursor, now, num_writes=1):
+        """
+        Cull the table if it has more than max_entries entries, counting them
+        only once every cull_check_interval writes rather than on each write.
+        """
+        self._writes_since_cull_check += num_writes
+        if self._writes_since_cull_check < self._cull_check_interval:
+            return
+        self._writes_since_cull_check = 0
+        table = connections[db].ops.quote_name(self._table)
+        cursor.execute("SELECT COUNT(*) FROM %s" % table)
+        if cursor.fetchone()[0] > self._max_entries:
+            self._cull(db, cursor, now)
+
     def _cull(self, db, cursor, now):
         if self._cull_frequency == 0:
             self.clear()
@@ -1,9 +1,11 @@
 "File-based cache backend"
 import glob
 import hashlib
+import mmap
 import os
 import pickle
 import random
+import struct
 import tempfile
 import time
 import zlib
@@ -13,9 +15,9 @@ from django.core.files import locks
 from django.core.files.move import file_move_safe
 
 
-def _write_content(f, expiry, value):
+def _write_content(f, expiry, data):
     f.write(pickle.dumps(expiry, pickle.HIGHEST_PROTOCOL))
-    f.write(zlib.compress(pickle.dumps(value, pickle.HIGHEST_PROTOCOL)))
+    f.write(zlib.compress(data))
 
 
 class FileBasedCache(BaseCache):
@@ -37,7 +39,7 @@ class FileBasedCache(BaseCache):
         try:
             with open(fname, 'rb') as f:
                 if not self._is_expired(f):
-                    return pickle.loads(zlib.decompress(f.read()))
+                    return self.deserialize(zlib.decompress(f.read()))
         except FileNotFoundError:
             pass
         return default
@@ -51,7 +53,7 @@ class FileBasedCache(BaseCache):
         try:
             with open(fd, 'wb') as f:
                 expiry = self.get_backend_timeout(timeout)
-                _write_content(f, expiry, value)
+                _write_content(f, expiry, self.serialize(value))
             file_move_safe(tmp_path, fname, allow_overwrite=True)
             renamed = True
         finally:
@@ -66,9 +68,9 @@ class FileBasedCache(BaseCache):
                     if self._is_expired(f):
                         return False
                     else:
-                        previous_value = pickle.loads(zlib.decompress(f.read()))
+                        previous_data = zlib.decompress(f.read())
                         f.seek(0)
-                        _write_content(f, self.get_backend_timeout(timeout), previous_value)
+                        _write_content(f, self.get_backend_timeout(timeout), previous_data)
                         return True
                 finally:
                     locks.unlock(f)
@@ -162,3 +164,192 @@ class FileBasedCache(BaseCache):
         filelist = [os.path.join(self._dir, fname) for fname
                     in glob.glob1(self._dir, '*%s' % self.cache_suffix)]
         return filelist
+
+
+class ShardedFileBasedCache(FileBasedCache):
+    """
+    A file-based cache that stores entries in 256 subdirectories named after
+    the first two characters of their file names.
+
+    Each subdirectory holds an equal share of MAX_ENTRIES and has an index
+    file recording the expiry time, write time and size of its entries.
+    When a subdirectory is full, culling removes its expired entries first,
+    then the least recently written ones, without listing any directory.
+    Entries written by other means than this backend aren't culled.
+
+    If OPTIONS['MMAP'] is True, entries are memory-mapped to be read.
+    """
+    shard_count = 256
+    index_name = 'index'
+    # MD5 digest of the key, expiry time, write time and size of an entry.
+    index_record = struct.Struct('<16sddI')
+
+    def __init__(self, dir, params):
+        super().__init__(dir, params)
+        self._mmap = params.get('OPTIONS', {}).get('MMAP', False)
+        self._max_shard_entries = max(-(-self._max_entries // self.shard_count), 1)
+
+    def get(self, key, default=None, version=None):
+        if not self._mmap:
+            return super().get(key, default, version)
+        fname = self._key_to_file(key, version)
+        try:
+            with open(fname, 'rb') as f:
+                if not self._is_expired(f):
+                    offset = f.tell()
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+                            memoryview(mapped)[offset:] as data:
+                        serialized = zlib.decompress(data)
+                    return self.deserialize(serialized)
+        except FileNotFoundError:
+            pass
+        return default
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        fname = self._key_to_file(key, version)
+        shard_dir = os.path.dirname(fname)
+        os.makedirs(shard_dir, 0o700, exist_ok=True)
+        self._cull_shard(shard_dir)  # make some room if necessary
+        fd, tmp_path = tempfile.mkstemp(dir=shard_dir)
+        renamed = False
+        try:
+            with open(fd, 'wb') as f:
+                expiry = self.get_backend_timeout(timeout)
+                _write_content(f, expiry, self.serialize(value))
+                size = f.tell()
+            file_move_safe(tmp_path, fname, allow_overwrite=True)
+            renamed = True
+        finally:
+            if not renamed:
+                os.remove(tmp_path)
+        self._write_index_record(fname, expiry, size)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        if not super().touch(key, timeout, version):
+            return False
+        fname = self._key_to_file(key, version)
+        try:
+            size = os.path.getsize(fname)
+        except FileNotFoundError:
+            # The file may have been removed by another process.
+            pass
+        else:
+            self._write_index_record(fname, self.get_backend_timeout(timeout), size)
+        return True
+
+    def _delete(self, fname):
+        if not fname.startswith(self._dir) or not os.path.exists(fname):
+            return
+        try:
+            os.remove(fname)
+        except FileNotFoundError:
+            # The file may have been removed by another process.
+            return
+        # A size of 0 marks the entry as deleted.
+        self._write_index_record(fname, 0, 0)
+
+    def _write_index_record(self, fname, expiry, size):
+        record = self.index_record.pack(
+            bytes.fromhex(os.path.basename(fname)[:-len(self.cache_suffix)]),
+            float('inf') if expiry is None else expiry, time.time(), size,
+        )
+        index_path = os.path.join(os.path.dirname(fname), self.index_name)
+        with open(index_path, 'ab', buffering=0) as f:
+            locks.lock(f, locks.LOCK_EX)
+            try:
+                f.write(record)
+            finally:
+                locks.unlock(f)
+
+    def _read_index(self, f):
+        """
+        Return a dict mapping the digests of the entries in an open index
+        file to their latest (expiry, written, size) record.
+        """
+        data = f.read()
+        # Ignore a record truncated by a crash while it was written.
+        data = data[:len(data) - len(data) % self.index_record.size]
+        entries = {}
+        for digest, expiry, written, size in self.index_record.iter_unpack(data):
+            if size:
+                entries[digest] = (expiry, written, size)
+            else:
+                entries.pop(digest, None)
+        return entries
+
+    def _cull_shard(self, shard_dir):
+        """
+        Remove entries from shard_dir if its share of max_entries is reached,
+        expired entries first, then the least recently written ones, at a
+        ratio of num_entries / cull_frequency. A value of 0 for
+        CULL_FREQUENCY means that the entire subdirectory will be purged.
+        """
+        index_path = os.path.join(shard_dir, self.index_name)
+        try:
+            index_size = os.path.getsize(index_path)
+        except FileNotFoundError:
+            return
+        # The index has at least one record per entry.
+        if index_size // self.index_record.size < self._max_shard_entries:
+            return
+        with open(index_path, 'r+b') as f:
+            locks.lock(f, locks.LOCK_EX)
+            try:
+                entries = self._read_index(f)
+                if len(entries) >= self._max_shard_entries:
+                    now = time.time()
+                    ordered = sorted(entries, key=lambda d: (entries[d][0] >= now, entries[d][1]))
+                    if self._cull_frequency == 0:
+                        num_culled = len(ordered)
+                    else:
+                        num_expired = sum(1 for expiry, written, size in entries.values() if expiry < now)
+                        num_culled = max(len(entries) // self._cull_frequency, num_expired, 1)
+                    for digest in ordered[:num_culled]:
+                        try:
+                            os.remove(os.path.join(shard_dir, digest.hex() + self.cache_suffix))
+                        except FileNotFoundError:
+                            pass
+                        del entries[digest]
+                # Rewrite the index without the records it no longer needs.
+                f.seek(0)
+                f.truncate()
+                f.write(b''.join(
+                    self.index_record.pack(digest, *entry) for digest, entry in entries.items()
+                ))
+            finally:
+                locks.unlock(f)
+
+    def _key_to_file(self, key, version=None):
+        """
+        Convert a key into a cache file path. Basically this is the root
+        cache path joined with the first two characters of the md5sum of the
+        key, the md5sum, and a suffix.
+        """
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return os.path.join(self._dir, digest[:2], digest + self.cache_suffix)
+
+    def clear(self):
+        """
+        Remove all the cache files and indexes.
+        """
+        if not os.path.exists(self._dir):
+            return
+        paths = self._list_cache_files()
+        paths += glob.glob(os.path.join(self._dir, '*', self.index_name))
+        for path in paths:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def _list_cache_files(self):
+        """
+        Get a list of paths to all the cache files. These are all the files
+        in the subdirectories of the root cache dir that end on the
+        cache_suffix.
+        """
+        if not os.path.exists(self._dir):
+            return []
+        return glob.glob(os.path.join(self._dir, '*', '*%s' % self.cache_suffix))
@@ -1,5 +1,4 @@
 "Thread-safe in-memory cache backend."
-import pickle
 import time
 from collections import OrderedDict
 from threading import Lock
@@ -23,7 +22,7 @@ class LocMemCache(BaseCache):
     def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
-        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        pickled = self.serialize(value)
         with self._lock:
             if self._has_expired(key):
                 self._set(key, pickled, timeout)
@@ -39,7 +38,7 @@ class LocMemCache(BaseCache):
                 return default
             pickled = self._cache[key]
             self._cache.move_to_end(key, last=False)
-        return pickle.loads(pickled)
+        return self.deserialize(pickled)
 
     def _set(self, key, value, timeout=DEFAULT_TIMEOUT):
         if len(self._cache) >= self._max_entries:
@@ -51,7 +50,7 @@ class LocMemCache(BaseCache):
     def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
         self.validate_key(key)
-        pickled = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        pickled = self.serialize(value)
         with self._lock:
             self._set(key, pickled, timeout)
 
@@ -71,9 +70,9 @@ class LocMemCache(BaseCache):
                 self._delete(key)
                 raise ValueError("Key '%s' not found" % key)
             pickled = self._cache[key]
-            value = pickle.loads(pickled)
+            value = self.deserialize(pickled)
             new_value = value + delta
-            pickled = pickle.dumps(new_value, pickle.HIGHEST_PROTOCOL)
+            pickled = self.serialize(new_value)
             self._cache[key] = pickled
             self._cache.move_to_end(key, last=False)
         return new_value
@@ -118,3 +117,158 @@ class LocMemCache(BaseCache):
         with self._lock:
             self._cache.clear()
             self._expire_info.clear()
+
+
+# Global in-memory store of the shards of ShardedLocMemCache, keyed by name.
+_shards = {}
+_shards_lock = Lock()
+
+
+class LocMemShard:
+    """A part of the data of a ShardedLocMemCache, with its own lock."""
+    def __init__(self):
+        self.lock = Lock()
+        # Pickled values, least recently used first.
+        self.cache = OrderedDict()
+        self.expire_info = {}
+        # Total size of the serialized values.
+        self.size = 0
+
+
+class ShardedLocMemCache(BaseCache):
+    """
+    An in-memory cache whose keys are spread over OPTIONS['SHARDS'] shards
+    (16 by default) with a lock each, so that threads using different keys
+    rarely wait for each other.
+
+    Each shard holds an equal part of MAX_ENTRIES and of OPTIONS['MAX_BYTES']
+    (the total size of the serialized values, unlimited by default) and evicts
+    its least recently used keys one at a time to stay within them.
+    CULL_FREQUENCY isn't used.
+    """
+    def __init__(self, name, params):
+        super().__init__(params)
+        options = params.get('OPTIONS', {})
+        with _shards_lock:
+            if name not in _shards:
+                _shards[name] = [LocMemShard() for i in range(int(options.get('SHARDS', 16)))]
+        self._shards = _shards[name]
+        shard_count = len(self._shards)
+        self._max_shard_entries = max(self._max_entries // shard_count, 1)
+        max_bytes = options.get('MAX_BYTES')
+        self._max_shard_bytes = None if max_bytes is None else int(max_bytes) // shard_count
+
+    def _get_shard(self, key):
+        return self._shards[hash(key) % len(self._shards)]
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        pickled = self.serialize(value)
+        shard = self._get_shard(key)
+        with shard.lock:
+            if self._has_expired(shard, key):
+                self._set(shard, key, pickled, timeout)
+                return True
+            return False
+
+    def get(self, key, default=None, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        shard = self._get_shard(key)
+        with shard.lock:
+            if self._has_expired(shard, key):
+                self._delete(shard, key)
+                return default
+            pickled = shard.cache[key]
+            shard.cache.move_to_end(key)
+        return self.deserialize(pickled)
+
+    def _set(self, shard, key, value, timeout=DEFAULT_TIMEOUT):
+        self._delete(shard, key)
+        if self._max_shard_bytes is not None and len(value) > self._max_shard_bytes:
+            # Evicting every other key wouldn't make room for this value.
+            return
+        shard.cache[key] = value
+        shard.size += len(value)
+        shard.expire_info[key] = self.get_backend_timeout(timeout)
+        self._evict(shard)
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        pickled = self.serialize(value)
+        shard = self._get_shard(key)
+        with shard.lock:
+            self._set(shard, key, pickled, timeout)
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        key = self.make_key(key, version=version)
+        shard = self._get_shard(key)
+        with shard.lock:
+            if self._has_expired(shard, key):
+                return False
+            shard.expire_info[key] = self.get_backend_timeout(timeout)
+            return True
+
+    def incr(self, key, delta=1, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        shard = self._get_shard(key)
+        with shard.lock:
+            if self._has_expired(shard, key):
+                self._delete(shard, key)
+                raise ValueError("Key '%s' not found" % key)
+            pickled = shard.cache[key]
+            value = self.deserialize(pickled)
+            new_value = value + delta
+            pickled = self.serialize(new_value)
+            shard.size += len(pickled) - len(shard.cache[key])
+            shard.cache[key] = pickled
+            shard.cache.move_to_end(key)
+            self._evict(shard)
+        return new_value
+
+    def has_key(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        shard = self._get_shard(key)
+        with shard.lock:
+            if self._has_expired(shard, key):
+                self._delete(shard, key)
+                return False
+            return True
+
+    def _has_expired(self, shard, key):
+        exp = shard.expire_info.get(key, -1)
+        return exp is not None and exp <= time.time()
+
+    def _evict(self, shard):
+        while (len(shard.cache) > self._max_shard_entries or
+                self._max_shard_bytes is not None and shard.size > self._max_shard_bytes):
+            key, pickled = shard.cache.popitem(last=False)
+            shard.size -= len(pickled)
+            del shard.expire_info[key]
+
+    def _delete(self, shard, key):
+        try:
+            pickled = shard.cache.pop(key)
+        except KeyError:
+            pass
+        else:
+            shard.size -= len(pickled)
+            del shard.expire_info[key]
+
+    def delete(self, key, version=None):
+        key = self.make_key(key, version=version)
+        self.validate_key(key)
+        shard = self._get_shard(key)
+        with shard.lock:
+            self._delete(shard, key)
+
+    def clear(self):
+        for shard in self._shards:
+            with shard.lock:
+                shard.cache.clear()
+                shard.expire_info.clear()
+                shard.size = 0
@@ -24,6 +24,9 @@ class BaseMemcachedCache(BaseCache):
 
         self._lib = library
         self._options = params.get('OPTIONS') or {}
+        # Unless a serializer or compressor is set, let the client library
+        # serialize values.
+        self._serialize_values = 'SERIALIZER' in params or 'COMPRESSOR' in params
 
     @property
     def _cache(self):
@@ -62,20 +65,31 @@ class BaseMemcachedCache(BaseCache):
             timeout += int(time.time())
         return int(timeout)
 
+    def _encode(self, value):
+        # Integers are stored as is so that incr() and decr() work on them.
+        if self._serialize_values and type(value) is not int:
+            return self.serialize(value)
+        return value
+
+    def _decode(self, value):
+        if self._serialize_values and isinstance(value, bytes):
+            return self.deserialize(value)
+        return value
+
     def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
-        return self._cache.add(key, value, self.get_backend_timeout(timeout))
+        return self._cache.add(key, self._encode(value), self.get_backend_timeout(timeout))
 
     def get(self, key, default=None, version=None):
         key = self.make_key(key, version=version)
         val = self._cache.get(key)
         if val is None:
             return default
-        return val
+        return self._decode(val)
 
     def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
         key = self.make_key(key, version=version)
-        if not self._cache.set(key, value, self.get_backend_timeout(timeout)):
+        if not self._cache.set(key, self._encode(value), self.get_backend_timeout(timeout)):
             # make sure the key doesn't keep its old value in case of failure to set (memcached's 1MB limit)
             self._cache.delete(key)
 
@@ -88,7 +102,7 @@ class BaseMemcachedCache(BaseCache):
         ret = self._cache.get_multi(new_keys)
         if ret:
             m = dict(zip(new_keys, keys))
-            return {m[k]: v for k, v in ret.items()}
+            return {m[k]: self._decode(v) for k, v in ret.items()}
         return ret
 
     def close(self, **kwargs):
@@ -136,7 +150,7 @@ class BaseMemcachedCache(BaseCache):
         original_keys = {}
         for key, value in data.items():
             safe_key = self.make_key(key, version=version)
-            safe_data[safe_key] = value
+            safe_data[safe_key] = self._encode(value)
             original_keys[safe_key] = key
         failed_keys = self._cache.set_multi(safe_data, self.get_backend_timeout(timeout))
         return [original_keys[k] for k in failed_keys]
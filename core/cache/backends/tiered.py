@@ -0,0 +1,228 @@
+"Two-tier cache backend: an in-process cache in front of another cache."
+import time
+from collections import OrderedDict, namedtuple
+from threading import Lock
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+
+TieredCacheStats = namedtuple('TieredCacheStats', ['l1_hits', 'l2_hits', 'misses'])
+
+# Global in-process store of the first tier, keyed by the alias of the second
+# tier, to share it between threads.
+_l1_caches = {}
+_l1_caches_lock = Lock()
+
+_MISSING = object()
+
+
+class L1Cache:
+    """The in-process tier shared by the TieredCaches in front of an alias."""
+    def __init__(self):
+        self.lock = Lock()
+        # Tuples of (expiry, serialized value) by key, least recently used
+        # first.
+        self.entries = OrderedDict()
+        # The last stamp read from the second tier, and when.
+        self.stamp = None
+        self.stamp_checked_at = None
+        # Metrics.
+        self.l1_hits = 0
+        self.l2_hits = 0
+        self.misses = 0
+
+
+class TieredCache(BaseCache):
+    """
+    A cache keeping recently read values in process memory, in front of the
+    cache whose alias is the LOCATION, typically a memcached cache.
+
+    Values are kept in the first tier for at most OPTIONS['L1_TIMEOUT']
+    seconds (5 by default) and at most MAX_ENTRIES of them are kept, the
+    least recently used being evicted first. Keys are made by the second
+    tier, so KEY_PREFIX, VERSION and KEY_FUNCTION are set on it.
+
+    Writing through this backend updates the first tier of the current
+    process and increments a stamp stored in the second tier. Other processes
+    read the stamp at most every OPTIONS['STAMP_INTERVAL'] seconds (1 by
+    default) and empty their first tier when it changed, which bounds how
+    long they serve values that were changed or deleted.
+    """
+    stamp_key = 'django.core.cache.backends.tiered.stamp'
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        self._alias = location
+        options = params.get('OPTIONS', {})
+        self._l1_timeout = float(options.get('L1_TIMEOUT', 5))
+        self._stamp_interval = float(options.get('STAMP_INTERVAL', 1))
+        with _l1_caches_lock:
+            self._l1 = _l1_caches.setdefault(location, L1Cache())
+
+    @property
+    def _l2(self):
+        return caches[self._alias]
+
+    def stats(self):
+        l1 = self._l1
+        with l1.lock:
+            return TieredCacheStats(l1.l1_hits, l1.l2_hits, l1.misses)
+
+    def _check_stamp(self, now):
+        """Empty the first tier if a write happened since the last check."""
+        l1 = self._l1
+        if l1.stamp_checked_at is not None and now - l1.stamp_checked_at < self._stamp_interval:
+            return
+        l1.stamp_checked_at = now
+        stamp = self._l2.get(self.stamp_key)
+        with l1.lock:
+            if stamp != l1.stamp:
+                l1.entries.clear()
+                l1.stamp = stamp
+
+    def _bump_stamp(self):
+        l2 = self._l2
+        try:
+            l2.incr(self.stamp_key)
+        except ValueError:
+            l2.add(self.stamp_key, 1, None)
+
+    def _l1_get(self, key, now):
+        l1 = self._l1
+        with l1.lock:
+            entry = l1.entries.get(key)
+            if entry is None:
+                return _MISSING
+            if entry[0] <= now:
+                del l1.entries[key]
+                return _MISSING
+            l1.entries.move_to_end(key)
+            l1.l1_hits += 1
+        return self.deserialize(entry[1])
+
+    def _l1_set(self, key, value, timeout=DEFAULT_TIMEOUT):
+        ttl = self._l1_timeout
+        if timeout is not DEFAULT_TIMEOUT and timeout is not None:
+            ttl = min(ttl, timeout)
+        l1 = self._l1
+        with l1.lock:
+            if ttl <= 0:
+                l1.entries.pop(key, None)
+                return
+            l1.entries[key] = (time.monotonic() + ttl, self.serialize(value))
+            l1.entries.move_to_end(key)
+            while len(l1.entries) > self._max_entries:
+                l1.entries.popitem(last=False)
+
+    def _l1_delete(self, keys):
+        l1 = self._l1
+        with l1.lock:
+            for key in keys:
+                l1.entries.pop(key, None)
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        l2 = self._l2
+        if not l2.add(key, value, timeout, version):
+            return False
+        self._l1_set(l2.make_key(key, version), value, timeout)
+        self._bump_stamp()
+        return True
+
+    def get(self, key, default=None, version=None):
+        l2 = self._l2
+        cache_key = l2.make_key(key, version)
+        now = time.monotonic()
+        self._check_stamp(now)
+        value = self._l1_get(cache_key, now)
+        if value is not _MISSING:
+            return value
+        value = l2.get(key, _MISSING, version)
+        if value is _MISSING:
+            with self._l1.lock:
+                self._l1.misses += 1
+            return default
+        with self._l1.lock:
+            self._l1.l2_hits += 1
+        self._l1_set(cache_key, value)
+        return value
+
+    def get_many(self, keys, version=None):
+        l2 = self._l2
+        now = time.monotonic()
+        self._check_stamp(now)
+        result = {}
+        l2_keys = {}
+        for key in keys:
+            cache_key = l2.make_key(key, version)
+            value = self._l1_get(cache_key, now)
+            if value is _MISSING:
+                l2_keys[key] = cache_key
+            else:
+                result[key] = value
+        if l2_keys:
+            found = l2.get_many(l2_keys, version)
+            with self._l1.lock:
+                self._l1.l2_hits += len(found)
+                self._l1.misses += len(l2_keys) - len(found)
+            for key, value in found.items():
+                self._l1_set(l2_keys[key], value)
+            result.update(found)
+        return result
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        l2 = self._l2
+        l2.set(key, value, timeout, version)
+        self._l1_set(l2.make_key(key, version), value, timeout)
+        self._bump_stamp()
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        l2 = self._l2
+        failed_keys = l2.set_many(data, timeout, version)
+        for key, value in data.items():
+            if key not in failed_keys:
+                self._l1_set(l2.make_key(key, version), value, timeout)
+        self._bump_stamp()
+        return failed_keys
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self._l2.touch(key, timeout, version)
+
+    def delete(self, key, version=None):
+        self.delete_many([key], version)
+
+    def delete_many(self, keys, version=None):
+        l2 = self._l2
+        keys = list(keys)
+        l2.delete_many(keys, version)
+        self._l1_delete([l2.make_key(key, version) for key in keys])
+        self._bump_stamp()
+
+    def has_key(self, key, version=None):
+        l2 = self._l2
+        now = time.monotonic()
+        self._check_stamp(now)
+        with self._l1.lock:
+            entry = self._l1.entries.get(l2.make_key(key, version))
+            if entry is not None and entry[0] > now:
+                return True
+        return l2.has_key(key, version)
+
+    def incr(self, key, delta=1, version=None):
+        l2 = self._l2
+        value = l2.incr(key, delta, version)
+        self._l1_delete([l2.make_key(key, version)])
+        self._bump_stamp()
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        l2 = self._l2
+        value = l2.decr(key, delta, version)
+        self._l1_delete([l2.make_key(key, version)])
+        self._bump_stamp()
+        return value
+
+    def clear(self):
+        self._l2.clear()
+        with self._l1.lock:
+            self._l1.entries.clear()
+        self._bump_stamp()
@@ -0,0 +1,88 @@
+"""
+Serializers and compressors for cache values, set with the SERIALIZER and
+COMPRESSOR keys of a CACHES entry.
+
+A serializer has dumps() and loads() methods converting values to bytes and
+back; a compressor has compress() and decompress() methods.
+"""
+import pickle
+import zlib
+
+from django.utils.safestring import SafeText, mark_safe
+
+
+class PickleSerializer:
+    """Pickle values with the highest protocol. This is the default."""
+    def dumps(self, obj):
+        return pickle.dumps(obj, pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, data):
+        return pickle.loads(data)
+
+
+class PrimitiveSerializer(PickleSerializer):
+    """
+    Store strings, bytes, numbers, booleans and None as a one byte type tag
+    followed by their value, which is more compact and faster to load than
+    pickling them, and pickle other values. Since pickled data starts with the
+    pickle protocol marker, which isn't a type tag, this serializer also loads
+    values stored by PickleSerializer.
+    """
+    loaders = {
+        b's': bytes.decode,
+        b'S': lambda data: mark_safe(data.decode()),
+        b'b': bytes,
+        b'i': int,
+        b'f': float,
+        b'N': lambda data: None,
+        b'T': lambda data: True,
+        b'F': lambda data: False,
+    }
+
+    def dumps(self, obj):
+        # Exact type checks, subclasses are pickled to preserve their type.
+        obj_type = type(obj)
+        if obj_type is str:
+            return b's' + obj.encode()
+        if obj_type is SafeText:
+            return b'S' + obj.encode()
+        if obj_type is bytes:
+            return b'b' + obj
+        if obj_type is int:
+            return b'i%d' % obj
+        if obj_type is float:
+            return b'f' + repr(obj).encode()
+        if obj is None:
+            return b'N'
+        if obj is True:
+            return b'T'
+        if obj is False:
+            return b'F'
+        return super().dumps(obj)
+
+    def loads(self, data):
+        loader = self.loaders.get(data[:1])
+        if loader is None:
+            return pickle.loads(data)
+        return loader(data[1:])
+
+
+class ZlibCompressor:
+    def compress(self, data):
+        return zlib.compress(data)
+
+    def decompress(self, data):
+        return zlib.decompress(data)
+
+
+class LZMACompressor:
+    def __init__(self):
+        # lzma is an optional part of the standard library.
+        import lzma
+        self.lzma = lzma
+
+    def compress(self, data):
+        return self.lzma.compress(data)
+
+    def decompress(self, data):
+        return self.lzma.decompress(data)
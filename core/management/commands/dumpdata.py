@@ -1,3 +1,5 @@
+import gzip
+import os
 import warnings
 from collections import OrderedDict
 
@@ -7,6 +9,12 @@ from django.core.management.base import BaseCommand, CommandError
 from django.core.management.utils import parse_apps_and_model_labels
 from django.db import DEFAULT_DB_ALIAS, router
 
+try:
+    import bz2
+    has_bz2 = True
+except ImportError:
+    has_bz2 = False
+
 
 class ProxyModelWarning(Warning):
     pass
@@ -62,7 +70,8 @@ class Command(BaseCommand):
         )
         parser.add_argument(
             '-o', '--output', default=None, dest='output',
-            help='Specifies file to which the output is written.'
+            help='Specifies file to which the output is written. It is compressed '
+                 'if its name ends with .gz or .bz2.'
         )
 
     def handle(self, *app_labels, **options):
@@ -176,7 +185,15 @@ class Command(BaseCommand):
             if output and self.stdout.isatty() and options['verbosity'] > 0:
                 progress_output = self.stdout
                 object_count = sum(get_objects(count_only=True))
-            stream = open(output, 'w') if output else None
+            stream = None
+            if output:
+                # Compress the output if its extension is one that loaddata
+                # decompresses.
+                compression_formats = {'.gz': gzip.open}
+                if has_bz2:
+                    compression_formats['.bz2'] = bz2.open
+                open_method = compression_formats.get(os.path.splitext(output)[1], open)
+                stream = open_method(output, 'wt')
             try:
                 serializers.serialize(
                     format, get_objects(), indent=indent,
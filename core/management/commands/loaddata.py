@@ -2,9 +2,12 @@ import functools
 import glob
 import gzip
 import os
+import queue
 import sys
+import threading
 import warnings
 import zipfile
+from collections import OrderedDict
 from itertools import product
 
 from django.apps import apps
@@ -18,6 +21,7 @@ from django.db import (
     DEFAULT_DB_ALIAS, DatabaseError, IntegrityError, connections, router,
     transaction,
 )
+from django.db.models import signals
 from django.utils.functional import cached_property
 
 try:
@@ -35,6 +39,8 @@ class Command(BaseCommand):
         "No database fixture specified. Please provide the path of at least "
         "one fixture in the command line."
     )
+    # Maximum number of objects of a model waiting to be inserted together.
+    batch_size = 1000
 
     def add_arguments(self, parser):
         parser.add_argument('args', metavar='fixture', nargs='+', help='Fixture labels.')
@@ -59,6 +65,15 @@ class Command(BaseCommand):
             '--format', action='store', dest='format', default=None,
             help='Format of serialized data when reading from stdin.',
         )
+        parser.add_argument(
+            '--parallel', action='store', dest='parallel', type=int, default=1,
+            help='Number of connections saving objects of independent models at '
+                 'the same time. Models are loaded in order of their '
+                 'dependencies, one transaction per level of dependencies '
+                 'and connection, so the load isn\'t atomic. '
+                 'Ignored on databases that don\'t support concurrent writes, '
+                 'such as SQLite.',
+        )
 
     def handle(self, *fixture_labels, **options):
         self.ignore = options['ignore']
@@ -67,9 +82,24 @@ class Command(BaseCommand):
         self.verbosity = options['verbosity']
         self.excluded_models, self.excluded_apps = parse_apps_and_model_labels(options['exclude'])
         self.format = options['format']
+        self.parallel = options['parallel']
+        self.workers = {}
 
-        with transaction.atomic(using=self.using):
+        connection = connections[self.using]
+        if self.parallel > 1 and not (
+                connection.features.supports_concurrent_writes and
+                transaction.get_autocommit(self.using) and
+                READ_STDIN not in fixture_labels):
+            # Other connections couldn't write at the same time, or see the
+            # data of the current transaction, or read stdin again.
+            self.parallel = 1
+
+        if self.parallel > 1:
+            # Each level of models is loaded in its own transaction.
             self.loaddata(fixture_labels)
+        else:
+            with transaction.atomic(using=self.using):
+                self.loaddata(fixture_labels)
 
         # Close the DB connection -- unless we're still in a transaction. This
         # is required as a workaround for an edge case in MySQL: if the same
@@ -109,8 +139,11 @@ class Command(BaseCommand):
             return
 
         with connection.constraint_checks_disabled():
-            for fixture_label in fixture_labels:
-                self.load_label(fixture_label)
+            if self.parallel > 1:
+                self.load_parallel(fixture_labels)
+            else:
+                for fixture_label in fixture_labels:
+                    self.load_label(fixture_label)
 
         # Since we disabled constraint checks, we must manually check for
         # any invalid keys that might have been added
@@ -146,67 +179,285 @@ class Command(BaseCommand):
 
     def load_label(self, fixture_label):
         """Load fixtures files for a given label."""
-        show_progress = self.verbosity >= 3
         for fixture_file, fixture_dir, fixture_name in self.find_fixtures(fixture_label):
+            self.fixture_count += 1
+            objects_in_fixture = self.load_fixture(fixture_file, fixture_dir, fixture_name)
+            # Warn if the fixture we loaded contains 0 objects.
+            if objects_in_fixture == 0:
+                warnings.warn(
+                    "No fixture data found for '%s'. (File format may be "
+                    "invalid.)" % fixture_name,
+                    RuntimeWarning
+                )
+
+    def load_fixture(self, fixture_file, fixture_dir, fixture_name, models=None):
+        """
+        Load a fixture file, or only its objects whose concrete model is in
+        models if it's given, and return the number of objects read.
+        """
+        show_progress = self.verbosity >= 3
+        _, ser_fmt, cmp_fmt = self.parse_name(os.path.basename(fixture_file))
+        open_method, mode = self.compression_formats[cmp_fmt]
+        fixture = open_method(fixture_file, mode)
+        try:
+            objects_in_fixture = 0
+            loaded_objects_in_fixture = 0
+            if self.verbosity >= 2:
+                self.stdout.write(
+                    "Installing %s fixture '%s' from %s."
+                    % (ser_fmt, fixture_name, humanize(fixture_dir))
+                )
+
+            options = {} if models is None else {'only_models': models}
+            objects = serializers.deserialize(
+                ser_fmt, fixture, using=self.using, ignorenonexistent=self.ignore, **options
+            )
+
+            self.batches = OrderedDict()
+            for obj in objects:
+                if models is not None and obj.object._meta.concrete_model not in models:
+                    continue
+                objects_in_fixture += 1
+                if (obj.object._meta.app_config in self.excluded_apps or
+                        type(obj.object) in self.excluded_models):
+                    continue
+                if router.allow_migrate_model(self.using, obj.object.__class__):
+                    loaded_objects_in_fixture += 1
+                    self.models.add(obj.object.__class__)
+                    self.save_object(obj)
+                    if show_progress:
+                        self.stdout.write(
+                            '\rProcessed %i object(s).' % loaded_objects_in_fixture,
+                            ending=''
+                        )
+            for model in list(self.batches):
+                self.save_batch(model)
+            if objects and show_progress:
+                self.stdout.write('')  # add a newline after progress indicator
+            self.loaded_object_count += loaded_objects_in_fixture
+            self.fixture_object_count += objects_in_fixture
+        except Exception as e:
+            if not isinstance(e, CommandError):
+                e.args = ("Problem installing fixture '%s': %s" % (fixture_file, e),)
+            raise
+        finally:
+            fixture.close()
+        return objects_in_fixture
+
+    def load_parallel(self, fixture_labels):
+        """
+        Load the fixtures level by level of the dependency graph of the
+        models. Each level is read from the fixtures and committed before the
+        next one. Within a level, the independent groups of models are saved
+        at the same time by up to self.parallel LoadWorkers, each on its own
+        connection. The models whose objects are saved one at a time (see
+        can_batch()) are saved by this thread, like the objects of unknown
+        models.
+
+        The load isn't atomic: the levels are committed one after the other,
+        and the connections of a level commit separately. The workers commit
+        first, so that the level is rolled back on this connection if one of
+        them fails, but if this connection then fails to commit, the level is
+        partly loaded.
+        """
+        fixture_files = [
+            fixture for fixture_label in fixture_labels
+            for fixture in self.find_fixtures(fixture_label)
+        ]
+        self.fixture_count += len(fixture_files)
+        objects_in_fixtures = [0] * len(fixture_files)
+        levels = serializers.group_dependencies(self.get_fixture_models(fixture_files))
+        for level in levels:
+            models = {model for group in level for model in group}
+            worker_groups = [group for group in level if all(self.can_batch(model) for model in group)]
+            workers = [LoadWorker(self) for i in range(min(self.parallel, len(worker_groups)))]
+            self.workers = {
+                model: workers[i % len(workers)]
+                for i, group in enumerate(worker_groups) for model in group
+            }
+            for worker in workers:
+                worker.start()
+            try:
+                with transaction.atomic(using=self.using):
+                    try:
+                        for i, (fixture_file, fixture_dir, fixture_name) in enumerate(fixture_files):
+                            objects_in_fixtures[i] += self.load_fixture(
+                                fixture_file, fixture_dir, fixture_name, models,
+                            )
+                    finally:
+                        for worker in workers:
+                            worker.queue.put(None)
+                        for worker in workers:
+                            worker.ready.wait()
+                    self.raise_worker_error(workers)
+                    # Commit the workers' transactions before this one.
+                    for worker in workers:
+                        worker.proceed.set()
+                    for worker in workers:
+                        worker.join()
+                    self.raise_worker_error(workers)
+            except BaseException:
+                for worker in workers:
+                    worker.abort = True
+                raise
+            finally:
+                for worker in workers:
+                    worker.proceed.set()
+                for worker in workers:
+                    worker.join()
+                self.workers = {}
+
+        for (fixture_file, fixture_dir, fixture_name), objects_in_fixture in zip(fixture_files, objects_in_fixtures):
+            # Warn if the fixture we loaded contains 0 objects.
+            if objects_in_fixture == 0:
+                warnings.warn(
+                    "No fixture data found for '%s'. (File format may be "
+                    "invalid.)" % fixture_name,
+                    RuntimeWarning
+                )
+
+    def raise_worker_error(self, workers):
+        errors = [worker.error for worker in workers if worker.error is not None]
+        if errors:
+            raise errors[0]
+
+    def get_fixture_models(self, fixture_files):
+        """
+        Return the concrete models of the objects in the fixture files,
+        without building the objects for the formats supporting the
+        only_models and seen_models options.
+        """
+        models = set()
+        for fixture_file, fixture_dir, fixture_name in fixture_files:
             _, ser_fmt, cmp_fmt = self.parse_name(os.path.basename(fixture_file))
             open_method, mode = self.compression_formats[cmp_fmt]
             fixture = open_method(fixture_file, mode)
             try:
-                self.fixture_count += 1
-                objects_in_fixture = 0
-                loaded_objects_in_fixture = 0
-                if self.verbosity >= 2:
-                    self.stdout.write(
-                        "Installing %s fixture '%s' from %s."
-                        % (ser_fmt, fixture_name, humanize(fixture_dir))
-                    )
-
                 objects = serializers.deserialize(
                     ser_fmt, fixture, using=self.using, ignorenonexistent=self.ignore,
+                    only_models=set(), seen_models=models,
                 )
-
                 for obj in objects:
-                    objects_in_fixture += 1
-                    if (obj.object._meta.app_config in self.excluded_apps or
-                            type(obj.object) in self.excluded_models):
-                        continue
-                    if router.allow_migrate_model(self.using, obj.object.__class__):
-                        loaded_objects_in_fixture += 1
-                        self.models.add(obj.object.__class__)
-                        try:
-                            obj.save(using=self.using)
-                            if show_progress:
-                                self.stdout.write(
-                                    '\rProcessed %i object(s).' % loaded_objects_in_fixture,
-                                    ending=''
-                                )
-                        # psycopg2 raises ValueError if data contains NUL chars.
-                        except (DatabaseError, IntegrityError, ValueError) as e:
-                            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
-                                'app_label': obj.object._meta.app_label,
-                                'object_name': obj.object._meta.object_name,
-                                'pk': obj.object.pk,
-                                'error_msg': e,
-                            },)
-                            raise
-                if objects and show_progress:
-                    self.stdout.write('')  # add a newline after progress indicator
-                self.loaded_object_count += loaded_objects_in_fixture
-                self.fixture_object_count += objects_in_fixture
+                    # The format ignores the options.
+                    models.add(obj.object._meta.concrete_model)
             except Exception as e:
                 if not isinstance(e, CommandError):
                     e.args = ("Problem installing fixture '%s': %s" % (fixture_file, e),)
                 raise
             finally:
                 fixture.close()
+        return models
 
-            # Warn if the fixture we loaded contains 0 objects.
-            if objects_in_fixture == 0:
-                warnings.warn(
-                    "No fixture data found for '%s'. (File format may be "
-                    "invalid.)" % fixture_name,
-                    RuntimeWarning
-                )
+    def save_object(self, obj):
+        """
+        Save a deserialized object, or queue it to be inserted along with
+        other objects of its model by save_batch() when saving it one at a
+        time isn't needed.
+        """
+        model = obj.object._meta.concrete_model
+        pk = obj.object.pk
+        if pk is None or not self.can_batch(type(obj.object)):
+            # Keep the order of the saves for the objects of this model.
+            self.save_batch(model)
+            self.dispatch(model, [obj])
+            return
+        batch = self.batches.setdefault(model, OrderedDict())
+        if pk in batch:
+            # The fixture updates an object it already contains.
+            self.save_batch(model)
+            batch = self.batches[model] = OrderedDict()
+        batch[pk] = obj
+        if len(batch) >= self.batch_size:
+            self.save_batch(model)
+
+    @functools.lru_cache(maxsize=None)
+    def can_batch(self, model):
+        """
+        Return whether objects of model can be inserted in batches, which
+        requires that no signal receivers expect them to be saved one at a
+        time, and that other objects can't look them up by natural key
+        while they're waiting to be inserted.
+        """
+        return not (
+            model._meta.concrete_model._meta.parents or
+            hasattr(model._default_manager, 'get_by_natural_key') or
+            signals.pre_save.has_listeners(model) or
+            signals.post_save.has_listeners(model)
+        )
+
+    def save_batch(self, model):
+        batch = self.batches.pop(model, None)
+        if batch:
+            self.dispatch(model, list(batch.values()))
+
+    def dispatch(self, model, objs):
+        """Save objs now, or queue them for the worker in charge of model."""
+        worker = self.workers.get(model)
+        if worker is None:
+            self.save_objects(model, objs)
+        else:
+            worker.queue.put((model, objs))
+
+    def save_single(self, obj):
+        try:
+            obj.save(using=self.using)
+        # psycopg2 raises ValueError if data contains NUL chars.
+        except (DatabaseError, IntegrityError, ValueError) as e:
+            e.args = ("Could not load %(app_label)s.%(object_name)s(pk=%(pk)s): %(error_msg)s" % {
+                'app_label': obj.object._meta.app_label,
+                'object_name': obj.object._meta.object_name,
+                'pk': obj.object.pk,
+                'error_msg': e,
+            },)
+            raise
+
+    def save_objects(self, model, objs):
+        """
+        Save deserialized objects of model: the ones that don't exist yet
+        with a few multi-row INSERT queries and the other ones one at a time,
+        the way obj.save() does, to update them.
+        """
+        connection = connections[self.using]
+        manager = model._base_manager.db_manager(self.using)
+        pks = [obj.object.pk for obj in objs if obj.object.pk is not None]
+        existing = set()
+        step = max(connection.ops.bulk_batch_size(['pk'], pks), 1)
+        for start in range(0, len(pks), step):
+            existing.update(
+                manager.filter(pk__in=pks[start:start + step]).values_list('pk', flat=True)
+            )
+        new = [obj for obj in objs if obj.object.pk is not None and obj.object.pk not in existing]
+        if new:
+            instances = [obj.object for obj in new]
+            fields = model._meta.local_concrete_fields
+            step = max(connection.ops.bulk_batch_size(fields, instances), 1)
+            try:
+                for start in range(0, len(instances), step):
+                    # Like obj.save(), store the values as is (raw=True),
+                    # without calling pre_save() on the fields.
+                    manager._insert(instances[start:start + step], fields=fields, raw=True, using=self.using)
+            # psycopg2 raises ValueError if data contains NUL chars.
+            except (DatabaseError, IntegrityError, ValueError) as e:
+                e.args = ("Could not load %(app_label)s.%(object_name)s(pk in %(pks)s): %(error_msg)s" % {
+                    'app_label': model._meta.app_label,
+                    'object_name': model._meta.object_name,
+                    'pks': ', '.join(str(obj.pk) for obj in instances[start:start + step]),
+                    'error_msg': e,
+                },)
+                raise
+            for obj in new:
+                obj.object._state.adding = False
+                obj.object._state.db = self.using
+                if obj.m2m_data:
+                    for accessor_name, object_list in obj.m2m_data.items():
+                        # A new object has no related objects to remove.
+                        if object_list:
+                            getattr(obj.object, accessor_name).set(object_list)
+                    obj.m2m_data = None
+        new = set(map(id, new))
+        for obj in objs:
+            if id(obj) not in new:
+                self.save_single(obj)
 
     @functools.lru_cache(maxsize=None)
     def find_fixtures(self, fixture_label):
@@ -330,6 +581,55 @@ class Command(BaseCommand):
         return name, ser_fmt, cmp_fmt
 
 
+class LoadWorker(threading.Thread):
+    """
+    A thread saving the objects queued by a loaddata command in a transaction
+    on its own connection. Once the queue is closed with None, it sets ready
+    and waits for proceed before committing, unless abort is set.
+    """
+    def __init__(self, command):
+        super().__init__(daemon=True)
+        self.command = command
+        self.queue = queue.Queue(maxsize=8)
+        self.ready = threading.Event()
+        self.proceed = threading.Event()
+        self.abort = False
+        self.error = None
+
+    def run(self):
+        using = self.command.using
+        connection = connections[using]
+        closed = False
+        try:
+            with transaction.atomic(using=using):
+                with connection.constraint_checks_disabled():
+                    for model, objs in iter(self.queue.get, None):
+                        # After an error, keep emptying the queue so that the
+                        # command doesn't block.
+                        if self.error is None:
+                            try:
+                                self.command.save_objects(model, objs)
+                            except Exception as e:
+                                self.error = e
+                    closed = True
+                self.ready.set()
+                self.proceed.wait()
+                if self.error is not None or self.abort:
+                    transaction.set_rollback(True, using=using)
+        except Exception as e:
+            if self.error is None:
+                self.error = e
+        finally:
+            if not closed:
+                # The transaction couldn't be started, e.g. because the
+                # database refused the connection. Empty the queue so that
+                # the command doesn't block.
+                for item in iter(self.queue.get, None):
+                    pass
+            self.ready.set()
+            connection.close()
+
+
 class SingleZipReader(zipfile.ZipFile):
 
     def __init__(self, *args, **kwargs):
@@ -337,8 +637,18 @@ class SingleZipReader(zipfile.ZipFile):
         if len(self.namelist()) != 1:
             raise ValueError("Zip-compressed fixtures must contain one file.")
 
-    def read(self):
-        return zipfile.ZipFile.read(self, self.namelist()[0])
+        self._member = None
+
+    def read(self, size=-1):
+        # Stream the file instead of reading it at once.
+        if self._member is None:
+            self._member = self.open(self.namelist()[0])
+        return self._member.read(size)
+
+    def close(self):
+        if self._member is not None:
+            self._member.close()
+        super().close()
 
 
 def humanize(dirname):
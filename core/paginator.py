@@ -1,7 +1,13 @@
+import base64
 import collections.abc
+import datetime
+import json
 import warnings
 from math import ceil
 
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Q
+from django.db.models.constants import LOOKUP_SEP
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
@@ -22,6 +28,10 @@ class EmptyPage(InvalidPage):
     pass
 
 
+class InvalidCursor(InvalidPage):
+    pass
+
+
 class Paginator:
 
     def __init__(self, object_list, per_page, orphans=0,
@@ -185,3 +195,199 @@ class Page(collections.abc.Sequence):
         if self.number == self.paginator.num_pages:
             return self.paginator.count
         return self.number * self.paginator.per_page
+
+
+class CursorPaginator:
+    """
+    Paginate a QuerySet by filtering on the values of its ordering key
+    after the last object of the previous page (keyset pagination), instead
+    of using an OFFSET, and without counting the objects. Pages are
+    identified by opaque cursors rather than numbers.
+
+    The ordering is the one of the QuerySet, or ordering if it's given, and
+    is made unique by adding the primary key. It must only contain names of
+    non-null fields; an index on them keeps every page fast. Foreign keys are
+    ordered by their column, not by the related model's ordering.
+    """
+
+    def __init__(self, object_list, per_page, orphans=0, allow_empty_first_page=True, ordering=None):
+        self.object_list = object_list
+        self.per_page = int(per_page)
+        # orphans and allow_empty_first_page are accepted for compatibility
+        # with Paginator but ignored, since pages aren't counted.
+        if ordering is None:
+            ordering = object_list.query.order_by or object_list.model._meta.ordering
+        ordering = list(ordering)
+        for name in ordering:
+            if not isinstance(name, str) or name == '?':
+                raise ValueError(
+                    'CursorPaginator requires an ordering on field names, got %r.' % (name,)
+                )
+        if not any(name.lstrip('-') in ('pk', object_list.model._meta.pk.name) for name in ordering):
+            ordering.append('-pk' if ordering and ordering[-1].startswith('-') else 'pk')
+        # Tuples of (field name, descending).
+        self.ordering = []
+        self.fields = []
+        for name in ordering:
+            descending = name.startswith('-')
+            name, field = self._get_field(name.lstrip('-'))
+            self.ordering.append((name, descending))
+            self.fields.append(field)
+
+    def _get_field(self, name):
+        """
+        Return a tuple (name, field) for a name in the ordering. A relation is
+        replaced by its column, e.g. 'author' by 'author_id', so that objects
+        are ordered and compared by the value stored on them rather than by
+        the related model.
+        """
+        model = self.object_list.model
+        field = None
+        parts = name.split(LOOKUP_SEP)
+        for part in parts:
+            if field is not None:
+                model = field.related_model
+            field = model._meta.pk if part == 'pk' else model._meta.get_field(part)
+        if field.is_relation:
+            if not field.concrete or field.many_to_many:
+                raise ValueError(
+                    'CursorPaginator cannot order by the multi-valued relation %r.' % name
+                )
+            parts[-1] = field.attname
+        return LOOKUP_SEP.join(parts), field
+
+    def _get_key(self, obj):
+        """Return the values of the ordering key of obj."""
+        key = []
+        for name, descending in self.ordering:
+            value = obj
+            for part in name.split(LOOKUP_SEP):
+                value = getattr(value, part)
+            key.append(value)
+        return key
+
+    def encode_cursor(self, obj, forward):
+        """
+        Return the cursor of the page after (or before, if forward is False)
+        obj.
+        """
+        key = [
+            value.isoformat() if isinstance(value, (datetime.date, datetime.time)) else value
+            for value in self._get_key(obj)
+        ]
+        data = json.dumps([forward, key], cls=DjangoJSONEncoder, separators=(',', ':'))
+        return base64.urlsafe_b64encode(data.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """Return a tuple (forward, key) for a cursor."""
+        try:
+            data = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            forward, key = json.loads(data.decode())
+            if not isinstance(forward, bool) or len(key) != len(self.fields):
+                raise ValueError
+            key = [field.to_python(value) for field, value in zip(self.fields, key)]
+        except Exception:
+            raise InvalidCursor(_('That page cursor is invalid'))
+        return forward, key
+
+    def _get_filter(self, key, forward):
+        """
+        Return a Q object matching the objects after key in the ordering,
+        or before it if forward is False.
+        """
+        q = Q()
+        for i, ((name, descending), value) in enumerate(zip(self.ordering, key)):
+            lookup = 'lt' if descending == forward else 'gt'
+            q_part = Q(**{'%s__%s' % (name, lookup): value})
+            for (previous_name, _descending), previous_value in zip(self.ordering[:i], key):
+                q_part &= Q(**{previous_name: previous_value})
+            q |= q_part
+        return q
+
+    def get_page(self, cursor):
+        """Return a valid page, the first one if the cursor is invalid."""
+        try:
+            return self.page(cursor)
+        except InvalidCursor:
+            return self.page(None)
+
+    def page(self, cursor=None):
+        """Return a CursorPage for a cursor, or the first page if it's None."""
+        forward, key = (True, None) if not cursor else self.decode_cursor(cursor)
+        order_by = [
+            ('-' if descending == forward else '') + name
+            for name, descending in self.ordering
+        ]
+        queryset = self.object_list
+        if key is not None:
+            queryset = queryset.filter(self._get_filter(key, forward))
+        # Fetch one more object to know if there's another page.
+        object_list = list(queryset.order_by(*order_by)[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        del object_list[self.per_page:]
+        if forward:
+            has_next, has_previous = has_more, key is not None
+        elif not has_more:
+            # Fewer objects than per_page may be left before key.
+            return self.page(None)
+        else:
+            object_list.reverse()
+            has_next, has_previous = True, True
+        return self._get_page(object_list, self, has_next, has_previous)
+
+    def _get_page(self, *args, **kwargs):
+        """
+        Return an instance of a single page.
+
+        This hook can be used by subclasses to use an alternative to the
+        standard :cls:`CursorPage` object.
+        """
+        return CursorPage(*args, **kwargs)
+
+
+class CursorPage(collections.abc.Sequence):
+    """
+    A page of a CursorPaginator. It has no number; next_page_number() and
+    previous_page_number() return the cursors of the adjacent pages so that
+    templates written for Page work unchanged.
+    """
+    number = None
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return '<CursorPage of %d objects>' % len(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        if not isinstance(index, (int, slice)):
+            raise TypeError
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next and bool(self.object_list)
+
+    def has_previous(self):
+        return self._has_previous and bool(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_previous() or self.has_next()
+
+    def next_cursor(self):
+        if not self.has_next():
+            raise EmptyPage(_('That page contains no results'))
+        return self.paginator.encode_cursor(self.object_list[-1], forward=True)
+
+    def previous_cursor(self):
+        if not self.has_previous():
+            raise EmptyPage(_('That page contains no results'))
+        return self.paginator.encode_cursor(self.object_list[0], forward=False)
+
+    next_page_number = next_cursor
+    previous_page_number = previous_cursor
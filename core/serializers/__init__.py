@@ -27,6 +27,8 @@ BUILTIN_SERIALIZERS = {
     "xml": "django.core.serializers.xml_serializer",
     "python": "django.core.serializers.python",
     "json": "django.core.serializers.json",
+    "jsonl": "django.core.serializers.jsonl",
+    "tabular": "django.core.serializers.tabular",
     "yaml": "django.core.serializers.pyyaml",
 }
 
@@ -156,6 +158,39 @@ def _load_serializers():
     _serializers = serializers
 
 
+def get_model_dependencies(model, natural_keys_only=True):
+    """
+    Return the models that instances of model refer to: the dependencies
+    declared on its natural_key() method and the models it's related to by
+    a foreign key or a simple M2M relation. If natural_keys_only is True,
+    only the related models defining a natural key are included.
+    """
+    # Add any explicitly defined dependencies
+    if hasattr(model, 'natural_key'):
+        deps = getattr(model.natural_key, 'dependencies', [])
+        if deps:
+            deps = [apps.get_model(dep) for dep in deps]
+    else:
+        deps = []
+
+    # Now add a dependency for any FK relation with a model that
+    # defines a natural key
+    for field in model._meta.fields:
+        if field.remote_field:
+            rel_model = field.remote_field.model
+            if (hasattr(rel_model, 'natural_key') or not natural_keys_only) and rel_model != model:
+                deps.append(rel_model)
+    # Also add a dependency for any simple M2M relation with a model
+    # that defines a natural key.  M2M relations with explicit through
+    # models don't count as dependencies.
+    for field in model._meta.many_to_many:
+        if field.remote_field.through._meta.auto_created:
+            rel_model = field.remote_field.model
+            if (hasattr(rel_model, 'natural_key') or not natural_keys_only) and rel_model != model:
+                deps.append(rel_model)
+    return deps
+
+
 def sort_dependencies(app_list):
     """Sort a list of (app_config, models) pairs into a single list of models.
 
@@ -172,29 +207,7 @@ def sort_dependencies(app_list):
 
         for model in model_list:
             models.add(model)
-            # Add any explicitly defined dependencies
-            if hasattr(model, 'natural_key'):
-                deps = getattr(model.natural_key, 'dependencies', [])
-                if deps:
-                    deps = [apps.get_model(dep) for dep in deps]
-            else:
-                deps = []
-
-            # Now add a dependency for any FK relation with a model that
-            # defines a natural key
-            for field in model._meta.fields:
-                if field.remote_field:
-                    rel_model = field.remote_field.model
-                    if hasattr(rel_model, 'natural_key') and rel_model != model:
-                        deps.append(rel_model)
-            # Also add a dependency for any simple M2M relation with a model
-            # that defines a natural key.  M2M relations with explicit through
-            # models don't count as dependencies.
-            for field in model._meta.many_to_many:
-                if field.remote_field.through._meta.auto_created:
-                    rel_model = field.remote_field.model
-                    if hasattr(rel_model, 'natural_key') and rel_model != model:
-                        deps.append(rel_model)
+            deps = get_model_dependencies(model)
             model_dependencies.append((model, deps))
 
     model_dependencies.reverse()
@@ -232,3 +245,38 @@ def sort_dependencies(app_list):
         model_dependencies = skipped
 
     return model_list
+
+
+def group_dependencies(models):
+    """
+    Split a list of concrete models into levels, each one a list of groups
+    of models, such that the models of a level only depend on models of the
+    previous levels. Each group can then be loaded independently of the
+    other groups of its level.
+
+    Dependencies are found as in sort_dependencies(), but for all related
+    models. Models with circular dependencies, and the models depending on
+    them, are returned as a single group in the last level.
+    """
+    models = set(models)
+    model_dependencies = [
+        (model, {dep._meta.concrete_model for dep in get_model_dependencies(model, natural_keys_only=False)})
+        for model in sorted(models, key=lambda model: model._meta.label)
+    ]
+    levels = []
+    loaded = set()
+    while model_dependencies:
+        level = []
+        skipped = []
+        for model, deps in model_dependencies:
+            if all(d not in models or d == model or d in loaded for d in deps):
+                level.append([model])
+            else:
+                skipped.append((model, deps))
+        if not level:
+            levels.append([[model for model, deps in skipped]])
+            break
+        loaded.update(group[0] for group in level)
+        levels.append(level)
+        model_dependencies = skipped
+    return levels
@@ -2,9 +2,11 @@
 Serialize data to/from JSON
 """
 
+import codecs
 import datetime
 import decimal
 import json
+import re
 import uuid
 
 from django.core.serializers.base import DeserializationError
@@ -15,6 +17,8 @@ from django.utils.duration import duration_iso_string
 from django.utils.functional import Promise
 from django.utils.timezone import is_aware
 
+WHITESPACE = re.compile(r'[ \t\n\r]*')
+
 
 class Serializer(PythonSerializer):
     """Convert a queryset to JSON."""
@@ -59,13 +63,17 @@ class Serializer(PythonSerializer):
 
 
 def Deserializer(stream_or_string, **options):
-    """Deserialize a stream or string of JSON data."""
-    if not isinstance(stream_or_string, (bytes, str)):
-        stream_or_string = stream_or_string.read()
+    """
+    Deserialize a stream or string of JSON data. Streams are parsed
+    incrementally, so that memory use doesn't grow with their size.
+    """
     if isinstance(stream_or_string, bytes):
         stream_or_string = stream_or_string.decode()
     try:
-        objects = json.loads(stream_or_string)
+        if isinstance(stream_or_string, str):
+            objects = json.loads(stream_or_string)
+        else:
+            objects = iter_json_array(stream_or_string)
         yield from PythonDeserializer(objects, **options)
     except (GeneratorExit, DeserializationError):
         raise
@@ -73,6 +81,72 @@ def Deserializer(stream_or_string, **options):
         raise DeserializationError() from exc
 
 
+def iter_json_array(stream, chunk_size=64 * 1024):
+    """
+    Yield the items of the JSON array read from stream, parsing them as
+    they're read instead of reading the whole stream first.
+    """
+    decoder = json.JSONDecoder()
+    text_decoder = codecs.getincrementaldecoder('utf-8')()
+    buf = ''
+    pos = 0
+    eof = False
+
+    def read():
+        nonlocal buf, pos, eof
+        chunk = stream.read(chunk_size)
+        if isinstance(chunk, bytes):
+            chunk = text_decoder.decode(chunk, final=not chunk)
+        eof = not chunk
+        buf = buf[pos:] + chunk
+        pos = 0
+
+    def skip_whitespace():
+        nonlocal pos
+        while True:
+            match = WHITESPACE.match(buf, pos)
+            pos = match.end()
+            if pos < len(buf) or eof:
+                return
+            read()
+
+    def expect(*chars):
+        nonlocal pos
+        skip_whitespace()
+        if pos == len(buf) or buf[pos] not in chars:
+            raise ValueError('Expecting %s at character %d' % (' or '.join(map(repr, chars)), pos))
+        pos += 1
+        return buf[pos - 1]
+
+    read()
+    expect('[')
+    skip_whitespace()
+    if buf.startswith(']', pos):
+        pos += 1
+    else:
+        while True:
+            skip_whitespace()
+            while True:
+                try:
+                    item, end = decoder.raw_decode(buf, pos)
+                except ValueError:
+                    # The item may continue in the next chunk.
+                    if eof:
+                        raise
+                else:
+                    # A number could continue in the next chunk too.
+                    if end < len(buf) or eof:
+                        break
+                read()
+            pos = end
+            yield item
+            if expect(',', ']') == ']':
+                break
+    skip_whitespace()
+    if pos < len(buf):
+        raise ValueError('Extra data at character %d' % pos)
+
+
 class DjangoJSONEncoder(json.JSONEncoder):
     """
     JSONEncoder subclass that knows how to encode date/time, decimal types, and
@@ -76,12 +76,17 @@ class Serializer(base.Serializer):
         return self.objects
 
 
-def Deserializer(object_list, *, using=DEFAULT_DB_ALIAS, ignorenonexistent=False, **options):
+def Deserializer(object_list, *, using=DEFAULT_DB_ALIAS, ignorenonexistent=False, only_models=None,
+                 seen_models=None, **options):
     """
     Deserialize simple Python objects back into Django ORM instances.
 
     It's expected that you pass the Python objects themselves (instead of a
     stream or a string) to the constructor
+
+    If only_models is given, objects whose concrete model isn't in it are
+    skipped. If seen_models is given, the concrete model of every object,
+    skipped or not, is added to it.
     """
     field_names_cache = {}  # Model: <list of field_names>
 
@@ -94,6 +99,10 @@ def Deserializer(object_list, *, using=DEFAULT_DB_ALIAS, ignorenonexistent=False
                 continue
             else:
                 raise
+        if seen_models is not None:
+            seen_models.add(Model._meta.concrete_model)
+        if only_models is not None and Model._meta.concrete_model not in only_models:
+            continue
         data = {}
         if 'pk' in d:
             try:
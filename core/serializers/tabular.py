@@ -0,0 +1,99 @@
+"""
+Serialize data to/from a compact tabular JSON format.
+
+Objects are written one per line as JSON arrays of values, after a header
+line giving the model and the names of the values. A new header is only
+written when the model or the fields change, so field names aren't repeated
+on every object as they are with the json format::
+
+    {"model":"auth.group","pk":true,"fields":["name","permissions"]}
+    [1,"editors",[25,26]]
+    [2,"readers",[]]
+"""
+
+import json
+
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.core.serializers.python import (
+    Deserializer as PythonDeserializer, Serializer as PythonSerializer,
+)
+
+
+class Serializer(PythonSerializer):
+    """Convert a queryset to tabular JSON."""
+    internal_use_only = False
+
+    def _init_options(self):
+        self._current = None
+        self._header = None
+        self.json_kwargs = self.options.copy()
+        self.json_kwargs.pop('stream', None)
+        self.json_kwargs.pop('fields', None)
+        # Each object must fit on a single line.
+        self.json_kwargs.pop('indent', None)
+        self.json_kwargs['separators'] = (',', ':')
+        self.json_kwargs.setdefault('cls', DjangoJSONEncoder)
+
+    def start_serialization(self):
+        self._init_options()
+
+    def end_object(self, obj):
+        # self._current has the field data
+        data = self.get_dump_object(obj)
+        has_pk = 'pk' in data
+        header = (data['model'], has_pk, list(self._current))
+        if header != self._header:
+            self._header = header
+            json.dump(
+                {'model': data['model'], 'pk': has_pk, 'fields': header[2]},
+                self.stream, **self.json_kwargs
+            )
+            self.stream.write("\n")
+        row = list(self._current.values())
+        if has_pk:
+            row.insert(0, data['pk'])
+        json.dump(row, self.stream, **self.json_kwargs)
+        self.stream.write("\n")
+        self._current = None
+
+    def getvalue(self):
+        # Grandparent super
+        return super(PythonSerializer, self).getvalue()
+
+
+def Deserializer(stream_or_string, **options):
+    """Deserialize a stream or string of tabular JSON, one line at a time."""
+    if isinstance(stream_or_string, bytes):
+        stream_or_string = stream_or_string.decode()
+    if isinstance(stream_or_string, str):
+        stream_or_string = stream_or_string.splitlines()
+    try:
+        yield from PythonDeserializer(_iter_objects(stream_or_string), **options)
+    except (GeneratorExit, DeserializationError):
+        raise
+    except Exception as exc:
+        raise DeserializationError() from exc
+
+
+def _iter_objects(lines):
+    """Yield the objects of tabular JSON lines in the python format."""
+    model = has_pk = fields = None
+    for line in lines:
+        if not line.strip():
+            continue
+        value = json.loads(line)
+        if isinstance(value, dict):
+            model, has_pk, fields = value['model'], value['pk'], value['fields']
+            continue
+        if model is None:
+            raise DeserializationError('Tabular data must start with a header.')
+        if len(value) != len(fields) + has_pk:
+            raise DeserializationError(
+                "Expected %d values for a %s object, got %d."
+                % (len(fields) + has_pk, model, len(value))
+            )
+        if has_pk:
+            yield {'model': model, 'pk': value[0], 'fields': dict(zip(fields, value[1:]))}
+        else:
+            yield {'model': model, 'fields': dict(zip(fields, value))}
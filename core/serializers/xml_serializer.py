@@ -149,11 +149,14 @@ class Serializer(base.Serializer):
 class Deserializer(base.Deserializer):
     """Deserialize XML."""
 
-    def __init__(self, stream_or_string, *, using=DEFAULT_DB_ALIAS, ignorenonexistent=False, **options):
+    def __init__(self, stream_or_string, *, using=DEFAULT_DB_ALIAS, ignorenonexistent=False, only_models=None,
+                 seen_models=None, **options):
         super().__init__(stream_or_string, **options)
         self.event_stream = pulldom.parse(self.stream, self._make_parser())
         self.db = using
         self.ignore = ignorenonexistent
+        self.only_models = only_models
+        self.seen_models = seen_models
 
     def _make_parser(self):
         """Create a hardened XML parser (no custom/external entities)."""
@@ -163,6 +166,13 @@ class Deserializer(base.Deserializer):
         for event, node in self.event_stream:
             if event == "START_ELEMENT" and node.nodeName == "object":
                 self.event_stream.expandNode(node)
+                if self.only_models is not None or self.seen_models is not None:
+                    Model = self._get_model_from_node(node, "model")
+                    if self.seen_models is not None:
+                        self.seen_models.add(Model._meta.concrete_model)
+                    # Skip objects of the other models.
+                    if self.only_models is not None and Model._meta.concrete_model not in self.only_models:
+                        continue
                 return self._handle_object(node)
         raise StopIteration
 
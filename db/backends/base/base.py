@@ -11,6 +11,7 @@ from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.db import DEFAULT_DB_ALIAS
 from django.db.backends import utils
+from django.db.backends.base.pool import get_pool
 from django.db.backends.base.validation import BaseDatabaseValidation
 from django.db.backends.signals import connection_created
 from django.db.transaction import TransactionManagementError
@@ -48,6 +49,8 @@ class BaseDatabaseWrapper:
         # Connection related attributes.
         # The underlying database connection.
         self.connection = None
+        # The ConnectionPool the connection was checked out from, if any.
+        self.pool = None
         # `settings_dict` should be a dictionary containing keys such as
         # NAME, USER, etc. It's called `settings_dict` instead of `settings`
         # to disambiguate it from Django settings modules.
@@ -191,10 +194,20 @@ class BaseDatabaseWrapper:
         self.errors_occurred = False
         # Establish the connection
         conn_params = self.get_connection_params()
-        self.connection = self.get_new_connection(conn_params)
+        conn_params.pop('pool', None)
+        self.pool = get_pool(self.settings_dict, self.alias)
+        if self.pool is None:
+            self.connection, created = self.get_new_connection(conn_params), True
+        else:
+            # Pooled connections are returned to the pool when they're closed
+            # rather than after CONN_MAX_AGE.
+            self.close_at = None
+            self.connection, created = self.pool.checkout(self, conn_params)
         self.set_autocommit(self.settings_dict['AUTOCOMMIT'])
-        self.init_connection_state()
-        connection_created.send(sender=self.__class__, connection=self)
+        # Connections reused from the pool keep their session state.
+        if created:
+            self.init_connection_state()
+            connection_created.send(sender=self.__class__, connection=self)
 
         self.run_on_commit = []
 
@@ -284,7 +297,10 @@ class BaseDatabaseWrapper:
         if self.closed_in_transaction or self.connection is None:
             return
         try:
-            self._close()
+            if self.pool is None:
+                self._close()
+            else:
+                self._close_pooled()
         finally:
             if self.in_atomic_block:
                 self.closed_in_transaction = True
@@ -292,6 +308,26 @@ class BaseDatabaseWrapper:
             else:
                 self.connection = None
 
+    def _close_pooled(self):
+        """
+        Return the connection to its pool, or discard it if it may not be in
+        a clean state.
+        """
+        clean = not (
+            self.in_atomic_block or self.errors_occurred or
+            self.autocommit != self.settings_dict['AUTOCOMMIT']
+        )
+        if clean and not self.autocommit:
+            # Don't hand out a connection with a transaction in progress.
+            try:
+                self._rollback()
+            except DatabaseError:
+                clean = False
+        if clean:
+            self.pool.checkin(self.connection)
+        else:
+            self.pool.discard(self, self.connection)
+
     # ##### Backend-specific savepoint management methods #####
 
     def _savepoint(self, sid):
@@ -513,6 +549,10 @@ class BaseDatabaseWrapper:
                 self.close()
                 return
 
+            # Pooled connections are only held for the duration of a request.
+            if self.pool is not None and not self.in_atomic_block:
+                self.close()
+
     # ##### Thread safety handling #####
 
     def validate_thread_sharing(self):
@@ -23,6 +23,13 @@ class BaseDatabaseFeatures:
     supports_partially_nullable_unique_constraints = True
 
     can_use_chunked_reads = True
+    # How QuerySet.iterator() streams rows from a chunked cursor: 'server'
+    # (the result set is kept on the server and rows are sent on demand),
+    # 'stepped' (the driver fetches rows from the database incrementally), or
+    # None (the driver buffers the whole result set in client memory). It only
+    # describes the backend's cursors: SQLite and Oracle, reported as
+    # 'stepped', already fetched rows that way.
+    chunked_fetch_mode = None
     can_return_id_from_insert = False
     can_return_ids_from_bulk_insert = False
     has_bulk_insert = True
@@ -89,6 +96,10 @@ class BaseDatabaseFeatures:
     # Does the backend order NULL values as largest or smallest?
     nulls_order_largest = False
 
+    # Does the backend need a CAST around the CASE expressions built by
+    # QuerySet.bulk_update() to resolve their type?
+    requires_casted_case_in_updates = False
+
     # The database's limit on the number of query parameters.
     max_query_params = None
 
@@ -99,6 +110,9 @@ class BaseDatabaseFeatures:
     # deferred
     can_defer_constraint_checks = False
 
+    # Can several connections write to the database at the same time?
+    supports_concurrent_writes = True
+
     # date_interval_sql can properly handle mixed Date/DateTime fields and timedeltas
     supports_mixed_date_datetime_comparisons = True
 
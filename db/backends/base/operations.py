@@ -79,6 +79,16 @@ class BaseDatabaseOperations:
         """
         return "SELECT cache_key FROM %s ORDER BY cache_key LIMIT 1 OFFSET %%s"
 
+    def cache_upsert_sql(self, num_rows):
+        """
+        Return an SQL query that inserts num_rows (cache_key, value, expires)
+        rows, replacing the value and expires of the cache keys that already
+        exist, or None if the database doesn't support it.
+
+        This is used by the 'db' cache backend to set many keys at once.
+        """
+        return None
+
     def unification_cast_sql(self, output_field):
         """
         Given a field instance, return the SQL that casts the result of a union
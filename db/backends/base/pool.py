@@ -0,0 +1,147 @@
+import threading
+import time
+from collections import deque, namedtuple
+
+from django.db.utils import DatabaseError, OperationalError
+
+PoolStats = namedtuple('PoolStats', [
+    'max_size', 'size', 'idle', 'checkouts', 'waits', 'wait_time', 'checkout_time',
+])
+
+
+class ConnectionPool:
+    """
+    A bounded pool of database connections shared by all the threads using
+    the same database. Enabled with the 'pool' key of DATABASES['OPTIONS'],
+    set either to True or to a dict of arguments for this class.
+
+    A DatabaseWrapper checks a connection out when it connects and returns it
+    when it's closed, e.g. by close_old_connections() at the end of each
+    request. Idle connections are health-checked with is_usable() before
+    they're handed out again.
+    """
+    def __init__(self, max_size=10, timeout=30):
+        if max_size < 1:
+            raise ValueError('The connection pool max_size must be at least 1.')
+        self.max_size = max_size
+        self.timeout = timeout
+        # Raw connections that aren't checked out, most recently used last.
+        self._idle = deque()
+        # Number of open connections, checked out or idle.
+        self._size = 0
+        self._condition = threading.Condition()
+        # Metrics.
+        self.checkouts = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.checkout_time = 0.0
+
+    def checkout(self, wrapper, conn_params):
+        """
+        Return a tuple of (connection, created) where connection is an idle
+        connection that passed a health check, or a new connection opened
+        with wrapper.get_new_connection(conn_params). Block until one is
+        available if the pool is full.
+        """
+        start = time.monotonic()
+        connection = None
+        with self._condition:
+            waited = False
+            deadline = None if self.timeout is None else start + self.timeout
+            while not self._idle and self._size >= self.max_size:
+                waited = True
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise OperationalError(
+                        "Couldn't get a connection for database '%s' from the "
+                        "pool within %s seconds." % (wrapper.alias, self.timeout)
+                    )
+                self._condition.wait(remaining)
+            if self._idle:
+                connection = self._idle.pop()
+            else:
+                # Reserve a slot for the new connection.
+                self._size += 1
+            self.checkouts += 1
+            if waited:
+                self.waits += 1
+                self.wait_time += time.monotonic() - start
+        created = False
+        try:
+            if connection is not None and not self._is_usable(wrapper, connection):
+                self._close(wrapper, connection)
+                connection = None
+            if connection is None:
+                connection = wrapper.get_new_connection(conn_params)
+                created = True
+        except Exception:
+            self._release_slot()
+            raise
+        with self._condition:
+            self.checkout_time += time.monotonic() - start
+        return connection, created
+
+    def checkin(self, connection):
+        """Make a connection that is in a clean state available again."""
+        with self._condition:
+            self._idle.append(connection)
+            self._condition.notify()
+
+    def discard(self, wrapper, connection):
+        """Close a connection and free its slot in the pool."""
+        try:
+            self._close(wrapper, connection)
+        finally:
+            self._release_slot()
+
+    def stats(self):
+        with self._condition:
+            return PoolStats(
+                self.max_size, self._size, len(self._idle), self.checkouts,
+                self.waits, self.wait_time, self.checkout_time,
+            )
+
+    def _release_slot(self):
+        with self._condition:
+            self._size -= 1
+            self._condition.notify()
+
+    def _is_usable(self, wrapper, connection):
+        # Backends implement is_usable() and _close() on wrapper.connection.
+        previous, wrapper.connection = wrapper.connection, connection
+        try:
+            return wrapper.is_usable()
+        finally:
+            wrapper.connection = previous
+
+    def _close(self, wrapper, connection):
+        previous, wrapper.connection = wrapper.connection, connection
+        try:
+            wrapper._close()
+        except DatabaseError:
+            pass
+        finally:
+            wrapper.connection = previous
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(settings_dict, alias):
+    """
+    Return the ConnectionPool configured by settings_dict, creating it if
+    needed, or None if pooling isn't enabled.
+    """
+    options = settings_dict['OPTIONS'].get('pool')
+    if not options:
+        return None
+    # Test databases are created under the same alias with another NAME.
+    key = (alias, settings_dict['NAME'], settings_dict['HOST'], settings_dict['PORT'], settings_dict['USER'])
+    try:
+        return _pools[key]
+    except KeyError:
+        with _pools_lock:
+            if key not in _pools:
+                _pools[key] = ConnectionPool(**(options if isinstance(options, dict) else {}))
+            return _pools[key]
@@ -21,6 +21,7 @@ except ImportError as err:
 
 from MySQLdb.constants import CLIENT, FIELD_TYPE                # isort:skip
 from MySQLdb.converters import conversions                      # isort:skip
+from MySQLdb.cursors import SSCursor                            # isort:skip
 
 # Some of these import MySQLdb, so import them after checking if it's installed.
 from .client import DatabaseClient                          # isort:skip
@@ -220,6 +221,8 @@ class DatabaseWrapper(BaseDatabaseWrapper):
                         ', '.join("'%s'" % s for s in sorted(self.isolation_levels))
                     ))
         self.isolation_level = isolation_level
+        # Not a connection argument, see chunked_cursor().
+        options.pop('server_side_cursors', None)
         kwargs.update(options)
         return kwargs
 
@@ -243,9 +246,30 @@ class DatabaseWrapper(BaseDatabaseWrapper):
                 cursor.execute('; '.join(assignments))
 
     def create_cursor(self, name=None):
-        cursor = self.connection.cursor()
+        if name:
+            # An unbuffered cursor leaves the result set on the server and
+            # reads rows as they're fetched. No other query may run on the
+            # connection until all rows are read or the cursor is closed.
+            cursor = self.connection.cursor(SSCursor)
+        else:
+            cursor = self.connection.cursor()
         return CursorWrapper(cursor)
 
+    @property
+    def server_side_cursors(self):
+        """
+        Whether QuerySet.iterator() uses an unbuffered cursor. Opt in with
+        OPTIONS['server_side_cursors']. While such a cursor is open, any other
+        query on the connection, e.g. saving an object or accessing a lazy
+        relation inside the loop, fails with "Commands out of sync".
+        """
+        return bool(self.settings_dict['OPTIONS'].get('server_side_cursors'))
+
+    def chunked_cursor(self):
+        if self.server_side_cursors:
+            return self._cursor(name='_django_sscursor')
+        return self.cursor()
+
     def _rollback(self):
         try:
             BaseDatabaseWrapper._rollback(self)
@@ -51,6 +51,12 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     # Alias MySQL's TRADITIONAL to TEXT for consistency with other backends.
     supported_explain_formats = {'JSON', 'TEXT', 'TRADITIONAL'}
 
+    @property
+    def chunked_fetch_mode(self):
+        # Results are buffered by the client unless server-side cursors are
+        # enabled.
+        return 'server' if self.connection.server_side_cursors else None
+
     @cached_property
     def _mysql_storage_engine(self):
         "Internal method used in Django tests. Don't rely on this from your code"
@@ -206,6 +206,13 @@ class DatabaseOperations(BaseDatabaseOperations):
     def max_name_length(self):
         return 64
 
+    def cache_upsert_sql(self, num_rows):
+        return (
+            'INSERT INTO %s (cache_key, value, expires) VALUES ' +
+            ', '.join(['(%%s, %%s, %%s)'] * num_rows) +
+            ' ON DUPLICATE KEY UPDATE value = VALUES(value), expires = VALUES(expires)'
+        )
+
     def bulk_insert_sql(self, fields, placeholder_rows):
         placeholder_rows_sql = (", ".join(row) for row in placeholder_rows)
         values_sql = ", ".join("(%s)" % sql for sql in placeholder_rows_sql)
@@ -4,6 +4,9 @@ from django.db.utils import InterfaceError
 
 class DatabaseFeatures(BaseDatabaseFeatures):
     empty_fetchmany_value = ()
+    # cx_Oracle cursors fetch `arraysize` rows per round trip rather than the
+    # whole result set.
+    chunked_fetch_mode = 'stepped'
     interprets_empty_strings_as_nulls = True
     uses_savepoints = True
     has_select_for_update = True
@@ -52,6 +52,16 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     supports_aggregate_filter_clause = True
     supported_explain_formats = {'JSON', 'TEXT', 'XML', 'YAML'}
     validates_explain_options = False  # A query will error on invalid options.
+    requires_casted_case_in_updates = True
+
+    @property
+    def chunked_fetch_mode(self):
+        # chunked_cursor() uses a server-side cursor, unless they're disabled
+        # (e.g. for pgbouncer's transaction pooling) and QuerySet.iterator()
+        # uses a regular client-side cursor instead.
+        if self.connection.settings_dict.get('DISABLE_SERVER_SIDE_CURSORS'):
+            return None
+        return 'server'
 
     @cached_property
     def is_postgresql_9_5(self):
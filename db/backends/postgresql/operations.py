@@ -225,6 +225,15 @@ class DatabaseOperations(BaseDatabaseOperations):
     def return_insert_id(self):
         return "RETURNING %s", ()
 
+    def cache_upsert_sql(self, num_rows):
+        if not self.connection.features.is_postgresql_9_5:
+            return None
+        return (
+            'INSERT INTO %s (cache_key, value, expires) VALUES ' +
+            ', '.join(['(%%s, %%s, %%s)'] * num_rows) +
+            ' ON CONFLICT (cache_key) DO UPDATE SET value = EXCLUDED.value, expires = EXCLUDED.expires'
+        )
+
     def bulk_insert_sql(self, fields, placeholder_rows):
         placeholder_rows_sql = (", ".join(row) for row in placeholder_rows)
         values_sql = ", ".join("(%s)" % sql for sql in placeholder_rows_sql)
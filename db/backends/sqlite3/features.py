@@ -7,9 +7,12 @@ class DatabaseFeatures(BaseDatabaseFeatures):
     # SQLite cannot handle us only partially reading from a cursor's result set
     # and then writing the same rows to the database in another cursor. This
     # setting ensures we always read result sets fully into memory all in one
-    # go.
+    # go. QuerySet.iterator() opts out of this and steps through the result
+    # set with fetchmany() instead.
     can_use_chunked_reads = False
+    chunked_fetch_mode = 'stepped'
     test_db_allows_multiple_connections = False
+    supports_concurrent_writes = False
     supports_unspecified_pk = True
     supports_timezones = False
     max_query_params = 999
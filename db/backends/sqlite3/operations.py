@@ -36,6 +36,12 @@ class DatabaseOperations(BaseDatabaseOperations):
         else:
             return len(objs)
 
+    def cache_upsert_sql(self, num_rows):
+        return (
+            'INSERT OR REPLACE INTO %s (cache_key, value, expires) VALUES ' +
+            ', '.join(['(%%s, %%s, %%s)'] * num_rows)
+        )
+
     def check_expression_support(self, expression):
         bad_fields = (fields.DateField, fields.DateTimeField, fields.TimeField)
         bad_aggregates = (aggregates.Sum, aggregates.Avg, aggregates.Variance, aggregates.StdDev)
@@ -377,6 +377,14 @@ class ModelState:
     # on the actual save.
     adding = True
     fields_cache = ModelStateFieldsCacheDescriptor()
+    # The AutoPrefetchGroup of the instance, see QuerySet.auto_prefetch().
+    auto_prefetch_group = None
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Don't pickle the instances loaded along with this one.
+        state.pop('auto_prefetch_group', None)
+        return state
 
 
 class Model(metaclass=ModelBase):
@@ -487,6 +495,19 @@ class Model(metaclass=ModelBase):
 
     @classmethod
     def from_db(cls, db, field_names, values):
+        attnames = cls._meta._fast_init_attnames
+        if attnames is not None and not (
+                (pre_init.receivers and pre_init.has_listeners(cls)) or
+                (post_init.receivers and post_init.has_listeners(cls))):
+            # Nothing can observe the difference with calling __init__(), so
+            # set the attributes directly. field_names only lists the loaded
+            # fields when some are deferred.
+            new = cls.__new__(cls)
+            new.__dict__.update(zip(field_names if len(values) != len(attnames) else attnames, values))
+            state = new._state = ModelState()
+            state.adding = False
+            state.db = db
+            return new
         if len(values) != len(cls._meta.concrete_fields):
             values_iter = iter(values)
             values = [
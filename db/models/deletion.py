@@ -61,6 +61,10 @@ def get_candidate_relations_to_delete(opts):
 
 
 class Collector:
+    # Maximum number of objects of the first model of a cascade delete deleted,
+    # along with the objects cascading from them, by each batch of queries.
+    cascade_batch_size = 10000
+
     def __init__(self, using):
         self.using = using
         # Initially, {model: {instances}}, later values become lists.
@@ -69,6 +73,10 @@ class Collector:
         # fast_deletes is a list of queryset-likes that can be deleted without
         # fetching the objects into memory.
         self.fast_deletes = []
+        # cascade_deletes is a list of querysets that can be deleted along with
+        # the objects cascading from them without fetching any of them into
+        # memory.
+        self.cascade_deletes = []
 
         # Tracks deletion-order dependency for databases without transactions
         # or ability to defer constraint checks. Only concrete model classes
@@ -151,6 +159,78 @@ class Collector:
             )
         )
 
+    def can_fast_delete_cascade(self, objs, from_field=None):
+        """
+        Determine if the objects in the given queryset-like and the objects
+        cascading from them can be deleted without fetching them into memory,
+        by filtering each model of the cascade on its relation to the
+        previous one. This can be done if no model of the cascade has parents
+        or signal listeners, if all the relations to them are CASCADE or
+        DO_NOTHING, and if the cascade doesn't loop.
+        """
+        if from_field and from_field.remote_field.on_delete is not CASCADE:
+            return False
+        if not (hasattr(objs, 'model') and hasattr(objs, '_raw_delete')):
+            return False
+        return self._can_fast_delete_cascade(objs.model, from_field, ())
+
+    def _can_fast_delete_cascade(self, model, from_field, seen):
+        opts = model._meta
+        if opts.concrete_model in seen:
+            return False
+        if (signals.pre_delete.has_listeners(model) or
+                signals.post_delete.has_listeners(model) or
+                signals.m2m_changed.has_listeners(model)):
+            return False
+        if not all(link == from_field for link in opts.concrete_model._meta.parents.values()):
+            return False
+        if any(hasattr(field, 'bulk_related_objects') for field in opts.private_fields):
+            return False
+        seen += (opts.concrete_model,)
+        for related in get_candidate_relations_to_delete(opts):
+            on_delete = related.field.remote_field.on_delete
+            if on_delete is DO_NOTHING:
+                continue
+            if on_delete is not CASCADE or not self._can_fast_delete_cascade(
+                    related.related_model, related.field, seen):
+                return False
+        return True
+
+    def delete_cascade(self, objs):
+        """
+        Delete the objects cascading from the ones in the queryset, the
+        deepest first, and then these objects, filtering each model on its
+        relation to the previous one. Return a Counter of the number of
+        objects deleted for each model label.
+        """
+        deleted_counter = Counter()
+        for related in get_candidate_relations_to_delete(objs.model._meta):
+            if related.field.remote_field.on_delete is CASCADE:
+                deleted_counter.update(self.delete_cascade(self.related_objects(related, objs)))
+        deleted_counter[objs.model._meta.label] += objs._raw_delete(using=self.using)
+        return deleted_counter
+
+    def delete_in_batches(self, qs):
+        """
+        Run delete_cascade() on batches of at most cascade_batch_size objects
+        of the queryset, so that each query only deals with the objects
+        cascading from one batch. The primary keys of the queryset are read
+        before anything is deleted, since deleting the objects cascading from
+        a batch may change which objects its filters match.
+        """
+        deleted_counter = Counter()
+        pks = list(qs.order_by('pk').values_list('pk', flat=True))
+        if not pks:
+            return deleted_counter
+        batch_size = min(
+            self.cascade_batch_size,
+            max(connections[self.using].ops.bulk_batch_size(['pk'], pks), 1),
+        )
+        manager = qs.model._base_manager.using(self.using)
+        for i in range(0, len(pks), batch_size):
+            deleted_counter.update(self.delete_cascade(manager.filter(pk__in=pks[i:i + batch_size])))
+        return deleted_counter
+
     def get_del_batches(self, objs, field):
         """
         Return the objs in suitably sized batches for the used connection.
@@ -185,6 +265,9 @@ class Collector:
         if self.can_fast_delete(objs):
             self.fast_deletes.append(objs)
             return
+        if self.can_fast_delete_cascade(objs):
+            self.cascade_deletes.append(objs)
+            return
         new_objs = self.add(objs, source, nullable,
                             reverse_dependency=reverse_dependency)
         if not new_objs:
@@ -217,6 +300,8 @@ class Collector:
                     sub_objs = self.related_objects(related, batch)
                     if self.can_fast_delete(sub_objs, from_field=field):
                         self.fast_deletes.append(sub_objs)
+                    elif self.can_fast_delete_cascade(sub_objs, from_field=field):
+                        self.cascade_deletes.append(sub_objs)
                     elif sub_objs:
                         field.remote_field.on_delete(self, field, sub_objs, self.using)
             for field in model._meta.private_fields:
@@ -282,6 +367,10 @@ class Collector:
                 count = qs._raw_delete(using=self.using)
                 deleted_counter[qs.model._meta.label] += count
 
+            # cascade deletes
+            for qs in self.cascade_deletes:
+                deleted_counter.update(self.delete_in_batches(qs))
+
             # update fields
             for model, instances_for_fieldvalues in self.field_updates.items():
                 for (field, value), instances in instances_for_fieldvalues.items():
@@ -143,6 +143,13 @@ class ForwardManyToOneDescriptor:
         # Assuming the database enforces foreign keys, this won't fail.
         return qs.get(self.field.get_reverse_related_filter(instance))
 
+    def needs_query(self, instance):
+        """
+        Return whether get_object() queries the database, in which case the
+        related objects of instance's auto-prefetch group are fetched first.
+        """
+        return True
+
     def __get__(self, instance, cls=None):
         """
         Get the related instance through the forward relation.
@@ -174,13 +181,20 @@ class ForwardManyToOneDescriptor:
             else:
                 rel_obj = None
             if rel_obj is None and has_value:
-                rel_obj = self.get_object(instance)
-                remote_field = self.field.remote_field
-                # If this is a one-to-one relation, set the reverse accessor
-                # cache on the related object to the current instance to avoid
-                # an extra SQL query if it's accessed later on.
-                if not remote_field.multiple:
-                    remote_field.set_cached_value(rel_obj, instance)
+                group = instance._state.auto_prefetch_group
+                if group is not None and self.needs_query(instance):
+                    group.prefetch(instance, self.field.name, self.is_cached)
+                if self.is_cached(instance):
+                    rel_obj = self.field.get_cached_value(instance)
+                else:
+                    rel_obj = self.get_object(instance)
+                    remote_field = self.field.remote_field
+                    # If this is a one-to-one relation, set the reverse
+                    # accessor cache on the related object to the current
+                    # instance to avoid an extra SQL query if it's accessed
+                    # later on.
+                    if not remote_field.multiple:
+                        remote_field.set_cached_value(rel_obj, instance)
             self.field.set_cached_value(instance, rel_obj)
 
         if rel_obj is None and not self.field.null:
@@ -296,6 +310,10 @@ class ForwardOneToOneDescriptor(ForwardManyToOneDescriptor):
                 return obj
         return super().get_object(instance)
 
+    def needs_query(self, instance):
+        # The parent is built from the instance's own fields.
+        return not self.field.remote_field.parent_link
+
     def __set__(self, instance, value):
         super().__set__(instance, value)
         # If the primary key is a link to a parent model and a parent instance
@@ -392,7 +410,12 @@ class ReverseOneToOneDescriptor:
             rel_obj = self.related.get_cached_value(instance)
         except KeyError:
             related_pk = instance.pk
-            if related_pk is None:
+            group = instance._state.auto_prefetch_group
+            if related_pk is not None and group is not None:
+                group.prefetch(instance, self.related.get_accessor_name(), self.is_cached)
+            if self.is_cached(instance):
+                rel_obj = self.related.get_cached_value(instance)
+            elif related_pk is None:
                 rel_obj = None
             else:
                 filter_args = self.related.field.get_forward_related_filter(instance)
@@ -592,6 +615,20 @@ def create_reverse_many_to_one_manager(superclass, rel):
                 queryset = super().get_queryset()
                 return self._apply_rel_filters(queryset)
 
+        def all(self):
+            group = self.instance._state.auto_prefetch_group
+            # Prefetching goes through the default manager, which a manager
+            # chosen with __call__() may filter differently.
+            if group is not None and superclass is self.model._default_manager.__class__:
+                cache_name = self.field.remote_field.get_cache_name()
+
+                def is_fetched(obj):
+                    return cache_name in getattr(obj, '_prefetched_objects_cache', ())
+
+                if not is_fetched(self.instance):
+                    group.prefetch(self.instance, rel.get_accessor_name(), is_fetched)
+            return super().all()
+
         def get_prefetch_queryset(self, instances, queryset=None):
             if queryset is None:
                 queryset = super().get_queryset()
@@ -873,6 +910,23 @@ def create_forward_many_to_many_manager(superclass, rel, reverse):
                 queryset = super().get_queryset()
                 return self._apply_rel_filters(queryset)
 
+        def all(self):
+            group = self.instance._state.auto_prefetch_group
+            # Prefetching goes through the default manager, which a manager
+            # chosen with __call__() may filter differently.
+            if group is not None and superclass is self.model._default_manager.__class__:
+                cache_name = self.prefetch_cache_name
+
+                def is_fetched(obj):
+                    return cache_name in getattr(obj, '_prefetched_objects_cache', ())
+
+                if not is_fetched(self.instance):
+                    group.prefetch(
+                        self.instance, rel.get_accessor_name() if reverse else rel.field.name,
+                        is_fetched,
+                    )
+            return super().all()
+
         def get_prefetch_queryset(self, instances, queryset=None):
             if queryset is None:
                 queryset = super().get_queryset()
@@ -68,7 +68,7 @@ class Options:
     FORWARD_PROPERTIES = {
         'fields', 'many_to_many', 'concrete_fields', 'local_concrete_fields',
         '_forward_fields_map', 'managers', 'managers_map', 'base_manager',
-        'default_manager',
+        'default_manager', '_fast_init_attnames',
     }
     REVERSE_PROPERTIES = {'related_objects', 'fields_map', '_relation_tree'}
 
@@ -825,3 +825,21 @@ class Options:
             if isinstance(attr, property):
                 names.append(name)
         return frozenset(names)
+
+    @cached_property
+    def _fast_init_attnames(self):
+        """
+        Return the attnames of the concrete fields if Model.from_db() may
+        store the values of instances directly in their __dict__, or None if
+        the model customizes __init__() or __setattr__(), or if a data
+        descriptor would intercept the assignment of an attname.
+        """
+        from django.db.models.base import Model
+        if self.model.__init__ is not Model.__init__ or self.model.__setattr__ is not Model.__setattr__:
+            return None
+        attnames = tuple(field.attname for field in self.concrete_fields)
+        for attname in attnames:
+            attr = inspect.getattr_static(self.model, attname, None)
+            if hasattr(type(attr), '__set__'):
+                return None
+        return attnames
@@ -4,8 +4,10 @@ The main QuerySet implementation. This provides the public API for the ORM.
 
 import copy
 import operator
+import threading
 import warnings
-from collections import OrderedDict, namedtuple
+from collections import Counter, OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from itertools import chain
 
@@ -18,9 +20,9 @@ from django.db import (
 from django.db.models import DateField, DateTimeField, sql
 from django.db.models.constants import LOOKUP_SEP
 from django.db.models.deletion import Collector
-from django.db.models.expressions import F
+from django.db.models.expressions import Case, Expression, F, Value, When
 from django.db.models.fields import AutoField
-from django.db.models.functions import Trunc
+from django.db.models.functions import Cast, Trunc
 from django.db.models.query_utils import FilteredRelation, InvalidQuery, Q
 from django.db.models.sql.constants import CURSOR, GET_ITERATOR_CHUNK_SIZE
 from django.utils import timezone
@@ -34,6 +36,12 @@ REPR_OUTPUT_SIZE = 20
 # Pull into this namespace for backwards compatibility.
 EmptyResultSet = sql.EmptyResultSet
 
+# The number of times each (model label, lookup) was prefetched by
+# QuerySet.auto_prefetch(), where the lookup could be given to
+# prefetch_related() on a QuerySet of the model instead.
+auto_prefetched_lookups = Counter()
+auto_prefetched_lookups_lock = threading.Lock()
+
 
 class BaseIterable:
     def __init__(self, queryset, chunked_fetch=False, chunk_size=GET_ITERATOR_CHUNK_SIZE):
@@ -41,6 +49,20 @@ class BaseIterable:
         self.chunked_fetch = chunked_fetch
         self.chunk_size = chunk_size
 
+    @property
+    def fetch_mode(self):
+        """
+        Return how rows are fetched from the database: 'server' or 'stepped'
+        when they're streamed (see DatabaseFeatures.chunked_fetch_mode), or
+        'buffered' when the whole result set is loaded into memory first,
+        e.g. when DISABLE_SERVER_SIDE_CURSORS is set.
+        """
+        if self.chunked_fetch:
+            mode = connections[self.queryset.db].features.chunked_fetch_mode
+            if mode is not None:
+                return mode
+        return 'buffered'
+
 
 class ModelIterable(BaseIterable):
     """Iterable that yields a model instance for each row."""
@@ -135,7 +157,7 @@ class ValuesListIterable(BaseIterable):
                     rowfactory,
                     compiler.results_iter(chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size)
                 )
-        return compiler.results_iter(tuple_expected=True, chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size)
+        return compiler.results_iter(chunked_fetch=self.chunked_fetch, chunk_size=self.chunk_size)
 
 
 class NamedValuesListIterable(ValuesListIterable):
@@ -189,7 +211,9 @@ class QuerySet:
         self._sticky_filter = False
         self._for_write = False
         self._prefetch_related_lookups = ()
+        self._prefetch_parallel = False
         self._prefetch_done = False
+        self._auto_prefetch = False
         self._known_related_objects = {}  # {rel_field: {pk: rel_obj}}
         self._iterable_class = ModelIterable
         self._fields = None
@@ -472,6 +496,56 @@ class QuerySet:
 
         return objs
 
+    def bulk_update(self, objs, fields, batch_size=None):
+        """
+        Update the given fields in each of the given objects in the database.
+        Like bulk_create(), don't call save() on each of the instances and
+        don't send any pre/post_save signals. Return the number of rows
+        matched.
+        """
+        assert batch_size is None or batch_size > 0
+        if not fields:
+            raise ValueError('Field names must be given to bulk_update().')
+        objs = tuple(objs)
+        if any(obj.pk is None for obj in objs):
+            raise ValueError('All bulk_update() objects must have a primary key set.')
+        fields = [self.model._meta.get_field(name) for name in fields]
+        if any(not f.concrete or f.many_to_many for f in fields):
+            raise ValueError('bulk_update() can only be used with concrete fields.')
+        if any(f.primary_key for f in fields):
+            raise ValueError('bulk_update() cannot be used with primary key fields.')
+        if not objs:
+            return 0
+        self._for_write = True
+        connection = connections[self.db]
+        # The pk is used twice in each batch, once in the WHEN clauses and
+        # once in the pk__in filter, so count it twice towards the limit on
+        # query parameters.
+        max_batch_size = max(connection.ops.bulk_batch_size(['pk', 'pk'] + fields, objs), 1)
+        batch_size = min(batch_size, max_batch_size) if batch_size else max_batch_size
+        requires_casting = connection.features.requires_casted_case_in_updates
+        updates = []
+        for batch_objs in [objs[i:i + batch_size] for i in range(0, len(objs), batch_size)]:
+            update_kwargs = {}
+            for field in fields:
+                when_statements = []
+                for obj in batch_objs:
+                    attr = getattr(obj, field.attname)
+                    if not isinstance(attr, Expression):
+                        attr = Value(attr, output_field=field)
+                    when_statements.append(When(pk=obj.pk, then=attr))
+                case_statement = Case(*when_statements, output_field=field)
+                if requires_casting:
+                    case_statement = Cast(case_statement, output_field=field)
+                update_kwargs[field.attname] = case_statement
+            updates.append(([obj.pk for obj in batch_objs], update_kwargs))
+        rows_updated = 0
+        with transaction.atomic(using=self.db, savepoint=False):
+            for pks, update_kwargs in updates:
+                rows_updated += self.filter(pk__in=pks).update(**update_kwargs)
+        return rows_updated
+    bulk_update.alters_data = True
+
     def get_or_create(self, defaults=None, **kwargs):
         """
         Look up an object with the given kwargs, creating one if necessary.
@@ -717,7 +791,10 @@ class QuerySet:
 
     def _prefetch_related_objects(self):
         # This method can only be called once the result cache has been filled.
-        prefetch_related_objects(self._result_cache, *self._prefetch_related_lookups)
+        prefetch_related_objects(
+            self._result_cache, *self._prefetch_related_lookups,
+            parallel=self._prefetch_parallel
+        )
         self._prefetch_done = True
 
     def explain(self, *, format=None, **options):
@@ -946,7 +1023,7 @@ class QuerySet:
             obj.query.select_related = True
         return obj
 
-    def prefetch_related(self, *lookups):
+    def prefetch_related(self, *lookups, parallel=False):
         """
         Return a new QuerySet instance that will prefetch the specified
         Many-To-One and Many-To-Many related objects when the QuerySet is
@@ -954,10 +1031,17 @@ class QuerySet:
 
         When prefetch_related() is called more than once, append to the list of
         prefetch lookups. If prefetch_related(None) is called, clear the list.
+
+        If parallel is True, the queries of lookups that don't depend on each
+        other, like sibling lookups, run concurrently. See
+        prefetch_related_objects().
         """
         clone = self._chain()
+        if parallel:
+            clone._prefetch_parallel = True
         if lookups == (None,):
             clone._prefetch_related_lookups = ()
+            clone._prefetch_parallel = False
         else:
             for lookup in lookups:
                 if isinstance(lookup, Prefetch):
@@ -968,6 +1052,18 @@ class QuerySet:
             clone._prefetch_related_lookups = clone._prefetch_related_lookups + lookups
         return clone
 
+    def auto_prefetch(self):
+        """
+        Return a new QuerySet instance whose model instances, when one of
+        their relations is first accessed on one of them, prefetch it for all
+        of them, like prefetch_related() would. This also applies to the
+        objects prefetched for them, and the lookups prefetched this way are
+        counted in auto_prefetched_lookups.
+        """
+        clone = self._chain()
+        clone._auto_prefetch = True
+        return clone
+
     def annotate(self, *args, **kwargs):
         """
         Return a query set in which the returned objects have been annotated
@@ -1173,6 +1269,8 @@ class QuerySet:
         c._sticky_filter = self._sticky_filter
         c._for_write = self._for_write
         c._prefetch_related_lookups = self._prefetch_related_lookups[:]
+        c._prefetch_parallel = self._prefetch_parallel
+        c._auto_prefetch = self._auto_prefetch
         c._known_related_objects = self._known_related_objects
         c._iterable_class = self._iterable_class
         c._fields = self._fields
@@ -1181,6 +1279,8 @@ class QuerySet:
     def _fetch_all(self):
         if self._result_cache is None:
             self._result_cache = list(self._iterable_class(self))
+            if self._auto_prefetch and issubclass(self._iterable_class, ModelIterable):
+                AutoPrefetchGroup.add(self.model, '', self._result_cache)
         if self._prefetch_related_lookups and not self._prefetch_done:
             self._prefetch_related_objects()
 
@@ -1479,10 +1579,50 @@ def normalize_prefetch_lookups(lookups, prefix=None):
     return ret
 
 
-def prefetch_related_objects(model_instances, *related_lookups):
+class AutoPrefetchGroup:
+    """
+    Model instances loaded together by a QuerySet in auto_prefetch() mode, or
+    prefetched together for such instances. lookup leads to them from the
+    QuerySet's model.
+    """
+    def __init__(self, model, lookup, instances):
+        self.model = model
+        self.lookup = lookup
+        self.instances = instances
+
+    @classmethod
+    def add(cls, model, lookup, instances):
+        if len(instances) > 1:
+            group = cls(model, lookup, instances)
+            for obj in instances:
+                obj._state.auto_prefetch_group = group
+
+    def prefetch(self, instance, name, is_fetched):
+        """
+        Prefetch the relation through the attribute name for the instances of
+        the group of the same class as instance for which is_fetched(obj) is
+        False.
+        """
+        instances = [
+            obj for obj in self.instances
+            if obj.__class__ is instance.__class__ and not is_fetched(obj)
+        ]
+        if len(instances) < 2:
+            return
+        lookup = LOOKUP_SEP.join(filter(None, [self.lookup, name]))
+        with auto_prefetched_lookups_lock:
+            auto_prefetched_lookups[self.model._meta.label, lookup] += 1
+        prefetch_related_objects(instances, name)
+
+
+def prefetch_related_objects(model_instances, *related_lookups, parallel=False):
     """
     Populate prefetched object caches for a list of model instances based on
     the lookups/Prefetch instances given.
+
+    If parallel is True, the lookups are walked as far as they can go without
+    prefetching, and the prefetches they're waiting for then run concurrently
+    (see get_prefetch_querysets()) before the walk resumes.
     """
     if not model_instances:
         return  # nothing to do
@@ -1495,10 +1635,50 @@ def prefetch_related_objects(model_instances, *related_lookups):
     auto_lookups = set()  # we add to this as we go through.
     followed_descriptors = set()  # recursion protection
 
+    # In parallel mode, the prefetches lookups are waiting for, by prefetch_to,
+    # and the waiting lookups. A lookup that queued a prefetch resumes past
+    # the check for lookups that are already done, since its own prefetch_to
+    # may be the one it queued.
+    pending_prefetches = OrderedDict()
+    waiting_lookups = []
+    resumed_lookups = set()
+
+    def add_prefetched(prefetch_to, lookup, descriptor, obj_list, additional_lookups):
+        # We need to ensure we don't keep adding lookups from the
+        # same relationships to stop infinite recursion. So, if we
+        # are already on an automatically added lookup, don't add
+        # the new lookups from relationships we've seen already.
+        if not (prefetch_to in done_queries and lookup in auto_lookups and descriptor in followed_descriptors):
+            done_queries[prefetch_to] = obj_list
+            new_lookups = normalize_prefetch_lookups(reversed(additional_lookups), prefetch_to)
+            auto_lookups.update(new_lookups)
+            all_lookups.extend(new_lookups)
+        followed_descriptors.add(descriptor)
+
     all_lookups = normalize_prefetch_lookups(reversed(related_lookups))
-    while all_lookups:
+    while all_lookups or pending_prefetches:
+        if not all_lookups:
+            # Every lookup is waiting for a prefetch. Run them and resume the
+            # lookups in the order they were met.
+            prefetch_querysets = get_prefetch_querysets([
+                (obj_list, prefetcher, lookup.get_current_queryset(level))
+                for obj_list, prefetcher, lookup, level, descriptor in pending_prefetches.values()
+            ])
+            for (prefetch_to, pending), prefetch_queryset in zip(pending_prefetches.items(), prefetch_querysets):
+                obj_list, prefetcher, lookup, level, descriptor = pending
+                obj_list, additional_lookups = prefetch_one_level(
+                    obj_list, prefetcher, lookup, level, prefetch_queryset,
+                )
+                add_prefetched(prefetch_to, lookup, descriptor, obj_list, additional_lookups)
+            pending_prefetches.clear()
+            all_lookups[:0] = reversed(waiting_lookups)
+            waiting_lookups.clear()
+            continue
+
         lookup = all_lookups.pop()
-        if lookup.prefetch_to in done_queries:
+        if id(lookup) in resumed_lookups:
+            resumed_lookups.remove(id(lookup))
+        elif lookup.prefetch_to in done_queries:
             if lookup.queryset:
                 raise ValueError("'%s' lookup was already seen with a different queryset. "
                                  "You may need to adjust the ordering of your lookups." % lookup.prefetch_to)
@@ -1562,18 +1742,15 @@ def prefetch_related_objects(model_instances, *related_lookups):
                                  "prefetching - this is an invalid parameter to "
                                  "prefetch_related()." % lookup.prefetch_through)
 
-            if prefetcher is not None and not is_fetched:
+            if prefetcher is not None and not is_fetched and parallel:
+                if prefetch_to not in pending_prefetches:
+                    pending_prefetches[prefetch_to] = (obj_list, prefetcher, lookup, level, descriptor)
+                    resumed_lookups.add(id(lookup))
+                waiting_lookups.append(lookup)
+                break
+            elif prefetcher is not None and not is_fetched:
                 obj_list, additional_lookups = prefetch_one_level(obj_list, prefetcher, lookup, level)
-                # We need to ensure we don't keep adding lookups from the
-                # same relationships to stop infinite recursion. So, if we
-                # are already on an automatically added lookup, don't add
-                # the new lookups from relationships we've seen already.
-                if not (prefetch_to in done_queries and lookup in auto_lookups and descriptor in followed_descriptors):
-                    done_queries[prefetch_to] = obj_list
-                    new_lookups = normalize_prefetch_lookups(reversed(additional_lookups), prefetch_to)
-                    auto_lookups.update(new_lookups)
-                    all_lookups.extend(new_lookups)
-                followed_descriptors.add(descriptor)
+                add_prefetched(prefetch_to, lookup, descriptor, obj_list, additional_lookups)
             else:
                 # Either a singly related object that has already been fetched
                 # (e.g. via select_related), or hopefully some other property
@@ -1652,12 +1829,54 @@ def get_prefetcher(instance, through_attr, to_attr):
     return prefetcher, rel_obj_descriptor, attr_found, is_fetched
 
 
-def prefetch_one_level(instances, prefetcher, lookup, level):
+def get_prefetch_querysets(prefetches):
+    """
+    Helper function for prefetch_related_objects().
+
+    Return the result of prefetcher.get_prefetch_queryset() for each of the
+    (instances, prefetcher, queryset) tuples in prefetches, with the returned
+    querysets evaluated but not their prefetch_related lookups. The calls run
+    concurrently in threads, each with its own connections. The result is a
+    list of None if that can't be done: when there's a single prefetch, or
+    when a connection of the current thread has uncommitted changes (in an
+    atomic block or with autocommit off), which other connections don't see,
+    or is to an in-memory SQLite database. Since the database a prefetch
+    queryset runs on isn't known before the call, every open connection is
+    checked, not only those the prefetches use.
+
+    Queries run in the threads aren't recorded in connection.queries of the
+    current thread, so CaptureQueriesContext and the like don't see them.
+    """
+    if len(prefetches) < 2:
+        return [None] * len(prefetches)
+    for connection in connections.all():
+        if connection.connection is not None and (
+                connection.in_atomic_block or not connection.get_autocommit() or
+                (connection.vendor == 'sqlite' and connection.is_in_memory_db())):
+            return [None] * len(prefetches)
+
+    def get_prefetch_queryset(instances, prefetcher, queryset):
+        try:
+            prefetch_queryset = prefetcher.get_prefetch_queryset(instances, queryset)
+            rel_qs = prefetch_queryset[0]
+            if isinstance(rel_qs, QuerySet) and rel_qs._result_cache is None:
+                rel_qs._result_cache = list(rel_qs._iterable_class(rel_qs))
+            return prefetch_queryset
+        finally:
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=len(prefetches)) as executor:
+        futures = [executor.submit(get_prefetch_queryset, *prefetch) for prefetch in prefetches]
+        return [future.result() for future in futures]
+
+
+def prefetch_one_level(instances, prefetcher, lookup, level, prefetch_queryset=None):
     """
     Helper function for prefetch_related_objects().
 
     Run prefetches on all instances using the prefetcher object,
-    assigning results to relevant caches in instance.
+    assigning results to relevant caches in instance. prefetch_queryset is
+    the result of prefetcher.get_prefetch_queryset() if it was already called.
 
     Return the prefetched objects along with any additional prefetches that
     must be done due to prefetch_related lookups found from default managers.
@@ -1675,8 +1894,9 @@ def prefetch_one_level(instances, prefetcher, lookup, level):
     # The 'values to be matched' must be hashable as they will be used
     # in a dictionary.
 
-    rel_qs, rel_obj_attr, instance_attr, single, cache_name, is_descriptor = (
-        prefetcher.get_prefetch_queryset(instances, lookup.get_current_queryset(level)))
+    if prefetch_queryset is None:
+        prefetch_queryset = prefetcher.get_prefetch_queryset(instances, lookup.get_current_queryset(level))
+    rel_qs, rel_obj_attr, instance_attr, single, cache_name, is_descriptor = prefetch_queryset
     # We have to handle the possibility that the QuerySet we just got back
     # contains some prefetch_related lookups. We don't want to trigger the
     # prefetch_related functionality by evaluating the query. Rather, we need
@@ -1695,6 +1915,13 @@ def prefetch_one_level(instances, prefetcher, lookup, level):
 
     all_related_objects = list(rel_qs)
 
+    group = instances[0]._state.auto_prefetch_group
+    if group is not None:
+        through_attr = lookup.prefetch_through.split(LOOKUP_SEP)[level]
+        AutoPrefetchGroup.add(
+            group.model, LOOKUP_SEP.join(filter(None, [group.lookup, through_attr])), all_related_objects,
+        )
+
     rel_obj_cache = {}
     for rel_obj in all_related_objects:
         rel_attr_val = rel_obj_attr(rel_obj)
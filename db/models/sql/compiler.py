@@ -1,6 +1,7 @@
 import collections
 import functools
 import re
+import threading
 import warnings
 from itertools import chain
 
@@ -19,6 +20,100 @@ from django.utils.inspect import func_supports_parameter
 
 FORCE = object()
 
+CompiledQueryCacheInfo = collections.namedtuple(
+    'CompiledQueryCacheInfo', ['hits', 'misses', 'maxsize', 'currsize'],
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def make_row_converter(width, layout):
+    """
+    Return a factory of functions converting a row of width values into a
+    tuple. layout is a tuple of (position, number of converters) pairs and
+    the factory takes the connection and, for each position, the expression
+    followed by its converters. Values at the other positions are copied.
+    """
+    params = ['connection']
+    values = ['row[%d]' % pos for pos in range(width)]
+    for pos, count in layout:
+        expression = 'expression_%d' % pos
+        params.append(expression)
+        value = values[pos]
+        for i in range(count):
+            converter = 'converter_%d_%d' % (pos, i)
+            params.append(converter)
+            value = '%s(%s, %s, connection)' % (converter, value, expression)
+        values[pos] = value
+    source = (
+        'def make(%s):\n'
+        '    def convert_row(row):\n'
+        '        return (%s)\n'
+        '    return convert_row\n'
+    ) % (', '.join(params), ''.join(value + ', ' for value in values))
+    namespace = {}
+    exec(compile(source, '<row converter>', 'exec'), namespace)
+    return namespace['make']
+
+
+class CompiledQueryCache:
+    """
+    A thread-safe LRU cache of SELECT statements compiled by SQLCompiler,
+    keyed on Query.get_structure_key(). Each entry also records the SQL of the
+    WHERE clause it was compiled with and the compiler state needed to read
+    the results; parameter values always come from the query being executed.
+    """
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self.hits = self.misses = 0
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, where_sql):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != where_sql:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key, where_sql, value):
+        with self._lock:
+            self._entries[key] = (where_sql, value)
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def cache_info(self):
+        with self._lock:
+            return CompiledQueryCacheInfo(self.hits, self.misses, self.maxsize, len(self._entries))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_compiled_query_caches = {}
+_compiled_query_caches_lock = threading.Lock()
+
+
+def get_compiled_query_cache(connection):
+    """
+    Return the CompiledQueryCache shared by all connections to the
+    connection's alias, or None if the COMPILED_QUERY_CACHE_SIZE setting of
+    the database isn't set.
+    """
+    maxsize = connection.settings_dict.get('COMPILED_QUERY_CACHE_SIZE')
+    if not maxsize:
+        return None
+    try:
+        return _compiled_query_caches[connection.alias]
+    except KeyError:
+        with _compiled_query_caches_lock:
+            return _compiled_query_caches.setdefault(connection.alias, CompiledQueryCache(maxsize))
+
 
 class SQLCompiler:
     def __init__(self, query, connection, using):
@@ -583,6 +678,37 @@ class SQLCompiler:
             # Finally do cleanup - get rid of the joins we created above.
             self.query.reset_refcounts(refcounts_before)
 
+    def as_sql_cached(self):
+        """
+        Like as_sql(), but reuse SQL compiled earlier for a query of the same
+        shape when the database has a compiled query cache. Only the WHERE
+        clause is compiled again, to check that it's unchanged and to collect
+        the parameters.
+        """
+        cache = get_compiled_query_cache(self.connection)
+        # Subclasses that compile other statements override as_sql().
+        if cache is None or type(self).as_sql is not SQLCompiler.as_sql:
+            return self.as_sql()
+        key = self.query.get_structure_key()
+        if key is None:
+            return self.as_sql()
+        key = (self.__class__, key)
+        where_sql, where_params = self.compile(self.query.where)
+        entry = cache.get(key, where_sql)
+        if entry is not None:
+            sql, self.select, self.klass_info, self.annotation_col_map, self.has_extra_select = entry
+            self.col_count = len(self.select)
+            self.where, self.having = self.query.where, None
+            return sql, tuple(where_params)
+        sql, params = self.as_sql()
+        # Only cache the SQL if all of its parameters come from the WHERE
+        # clause.
+        if sql and self.having is None and len(params) == len(where_params):
+            cache.set(key, where_sql, (
+                sql, self.select, self.klass_info, self.annotation_col_map, self.has_extra_select,
+            ))
+        return sql, params
+
     def get_default_columns(self, start_alias=None, opts=None, from_parent=None):
         """
         Compute the default columns for selecting every field in the base
@@ -996,19 +1122,34 @@ class SQLCompiler:
         return converters
 
     def apply_converters(self, rows, converters):
-        connection = self.connection
-        converters = list(converters.items())
-        for row in map(list, rows):
-            for pos, (convs, expression) in converters:
-                value = row[pos]
-                for converter in convs:
-                    value = converter(value, expression, connection)
-                row[pos] = value
-            yield row
+        """
+        Yield the rows as tuples with the converters applied to their values.
+        The conversion is done by a function specialized for the layout of
+        the rows, which is the same for all of them.
+        """
+        rows = iter(rows)
+        for row in rows:
+            width = len(row)
+            layout = tuple(
+                (pos, len(convs)) for pos, (convs, expression) in sorted(converters.items())
+                if pos < width
+            )
+            args = [self.connection]
+            for pos, count in layout:
+                convs, expression = converters[pos]
+                args.append(expression)
+                args.extend(convs)
+            convert_row = make_row_converter(width, layout)(*args)
+            yield convert_row(row)
+            yield from map(convert_row, rows)
 
     def results_iter(self, results=None, tuple_expected=False, chunked_fetch=False,
                      chunk_size=GET_ITERATOR_CHUNK_SIZE):
-        """Return an iterator over the results from executing this query."""
+        """
+        Return an iterator over the results from executing this query. Rows
+        are always tuples; tuple_expected is accepted for backwards
+        compatibility and ignored.
+        """
         if results is None:
             results = self.execute_sql(MULTI, chunked_fetch=chunked_fetch, chunk_size=chunk_size)
         fields = [s[0] for s in self.select[0:self.col_count]]
@@ -1016,8 +1157,6 @@ class SQLCompiler:
         rows = chain.from_iterable(results)
         if converters:
             rows = self.apply_converters(rows, converters)
-            if tuple_expected:
-                rows = map(tuple, rows)
         return rows
 
     def has_results(self):
@@ -1045,7 +1184,7 @@ class SQLCompiler:
         """
         result_type = result_type or NO_RESULTS
         try:
-            sql, params = self.as_sql()
+            sql, params = self.as_sql_cached()
             if not sql:
                 raise EmptyResultSet
         except EmptyResultSet:
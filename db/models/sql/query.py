@@ -56,6 +56,56 @@ def get_children_from_q(q):
             yield child
 
 
+def get_col_structure_key(col):
+    """
+    Return a hashable key identifying the column a Col refers to, or None if
+    the expression isn't a Col.
+    """
+    if type(col) is not Col:
+        return None
+    output_field = col.output_field
+    return (
+        col.alias, col.target.model, col.target.name,
+        getattr(output_field, 'model', None), output_field.name,
+    )
+
+
+def get_where_structure_key(node):
+    """
+    Return a hashable key describing the shape of a WhereNode, ignoring the
+    values compared against, or None if the node contains anything other than
+    lookups of a column against a single plain value.
+    """
+    children = []
+    for child in node.children:
+        if isinstance(child, WhereNode):
+            child_key = get_where_structure_key(child)
+        elif isinstance(child, Lookup):
+            lhs_key = get_col_structure_key(child.lhs)
+            rhs = child.rhs
+            if (lhs_key is None or hasattr(rhs, 'resolve_expression') or
+                    isinstance(rhs, (list, tuple, set, frozenset, dict, Iterator))):
+                return None
+            # Booleans (e.g. in __isnull lookups) may change the SQL itself.
+            rhs_key = rhs if isinstance(rhs, bool) else type(rhs)
+            child_key = (type(child), lhs_key, rhs_key)
+        else:
+            return None
+        if child_key is None:
+            return None
+        children.append(child_key)
+    return (type(node), node.connector, node.negated, tuple(children))
+
+
+def freeze_select_related(select_related):
+    """Return a hashable version of a Query.select_related value."""
+    if isinstance(select_related, dict):
+        return tuple(sorted(
+            (name, freeze_select_related(value)) for name, value in select_related.items()
+        ))
+    return select_related
+
+
 JoinInfo = namedtuple(
     'JoinInfo',
     ('final_field', 'targets', 'opts', 'joins', 'path', 'transform_function')
@@ -290,6 +340,44 @@ class Query:
         """
         return self.model._meta
 
+    def get_structure_key(self):
+        """
+        Return a hashable key describing the shape of the SQL this query
+        compiles to, ignoring the values of the parameters in its WHERE
+        clause, or None if the query can't be described that way.
+
+        Queries with equal keys compile to the same SQL apart from the WHERE
+        clause, which allows SQLCompiler to reuse compiled SQL with new
+        parameters.
+        """
+        if (self.combinator or self.subquery or self.external_aliases or
+                self._annotations or self._extra or self.extra_tables or
+                self.extra_order_by or self._filtered_relations or
+                self.group_by is not None or self.distinct_fields or
+                self.select_for_update or self.explain_query):
+            return None
+        if not all(isinstance(field_name, str) for field_name in self.order_by):
+            return None
+        select = tuple(get_col_structure_key(col) for col in self.select)
+        if None in select:
+            return None
+        where = get_where_structure_key(self.where)
+        if where is None:
+            return None
+        joins = tuple(
+            (alias, join.table_name, join.parent_alias, join.join_type,
+             getattr(join, 'join_cols', None), getattr(join, 'nullable', None),
+             self.alias_refcount[alias])
+            for alias, join in self.alias_map.items()
+        )
+        return (
+            self.__class__, self.model, joins, self.default_cols,
+            self.default_ordering, self.standard_ordering, self.order_by,
+            select, self.values_select, self.deferred_loading,
+            freeze_select_related(self.select_related), self.max_depth,
+            self.distinct, self.low_mark, self.high_mark, where,
+        )
+
     def clone(self):
         """
         Return a copy of the current Query. A lightweight alternative to
@@ -41,7 +41,14 @@ More details about how the caching works:
 * This middleware also sets ETag, Last-Modified, Expires and Cache-Control
   headers on the response object.
 
+* If CACHE_MIDDLEWARE_STALE_SECONDS is set, pages are kept in the cache that
+  many seconds after they expire. Only one request at a time, holding a lock
+  set with cache.add(), updates a missing or expired page that was cached
+  before. Meanwhile, other requests are served the expired page or, if
+  there's none, wait briefly for the update.
+
 """
+import time
 
 from django.conf import settings
 from django.core.cache import DEFAULT_CACHE_ALIAS, caches
@@ -63,6 +70,7 @@ class UpdateCacheMiddleware(MiddlewareMixin):
     """
     def __init__(self, get_response=None):
         self.cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
+        self.cache_stale_timeout = settings.CACHE_MIDDLEWARE_STALE_SECONDS
         self.key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
         self.cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
         self.cache = caches[self.cache_alias]
@@ -77,17 +85,28 @@ class UpdateCacheMiddleware(MiddlewareMixin):
             # We don't need to update the cache, just return.
             return response
 
+        self._update_cache(request, response)
+        lock_key = getattr(request, '_cache_lock_key', None)
+        if lock_key is not None:
+            # Release the lock once the page is cached, i.e. after rendering.
+            if hasattr(response, 'render') and callable(response.render):
+                response.add_post_render_callback(lambda r: self.cache.delete(lock_key))
+            else:
+                self.cache.delete(lock_key)
+        return response
+
+    def _update_cache(self, request, response):
         if response.streaming or response.status_code not in (200, 304):
-            return response
+            return
 
         # Don't cache responses that set a user-specific (and maybe security
         # sensitive) cookie in response to a cookie-less request.
         if not request.COOKIES and response.cookies and has_vary_header(response, 'Cookie'):
-            return response
+            return
 
         # Don't cache a response with 'Cache-Control: private'
         if 'private' in response.get('Cache-Control', ()):
-            return response
+            return
 
         # Try to get the timeout from the "max-age" section of the "Cache-
         # Control" header before reverting to using the default cache_timeout
@@ -97,17 +116,21 @@ class UpdateCacheMiddleware(MiddlewareMixin):
             timeout = self.cache_timeout
         elif timeout == 0:
             # max-age was set to 0, don't bother caching.
-            return response
+            return
         patch_response_headers(response, timeout)
         if timeout and response.status_code == 200:
-            cache_key = learn_cache_key(request, response, timeout, self.key_prefix, cache=self.cache)
+            cache_timeout = timeout
+            if self.cache_stale_timeout:
+                # Keep the page around to serve it while it's being updated.
+                response._cache_fresh_until = time.time() + timeout
+                cache_timeout += self.cache_stale_timeout
+            cache_key = learn_cache_key(request, response, cache_timeout, self.key_prefix, cache=self.cache)
             if hasattr(response, 'render') and callable(response.render):
                 response.add_post_render_callback(
-                    lambda r: self.cache.set(cache_key, r, timeout)
+                    lambda r: self.cache.set(cache_key, r, cache_timeout)
                 )
             else:
-                self.cache.set(cache_key, response, timeout)
-        return response
+                self.cache.set(cache_key, response, cache_timeout)
 
 
 class FetchFromCacheMiddleware(MiddlewareMixin):
@@ -118,8 +141,15 @@ class FetchFromCacheMiddleware(MiddlewareMixin):
     FetchFromCacheMiddleware must be the last piece of middleware in MIDDLEWARE
     so that it'll get called last during the request phase.
     """
+    # How long the lock taken to update a page may be held, and how long
+    # requests wait for the update when there's no stale page to serve.
+    lock_timeout = 30
+    lock_wait = 2
+    lock_poll_interval = 0.05
+
     def __init__(self, get_response=None):
         self.key_prefix = settings.CACHE_MIDDLEWARE_KEY_PREFIX
+        self.cache_stale_timeout = settings.CACHE_MIDDLEWARE_STALE_SECONDS
         self.cache_alias = settings.CACHE_MIDDLEWARE_ALIAS
         self.cache = caches[self.cache_alias]
         self.get_response = get_response
@@ -133,24 +163,64 @@ class FetchFromCacheMiddleware(MiddlewareMixin):
             request._cache_update_cache = False
             return None  # Don't bother checking the cache.
 
+        cache_key, response = self._get_cached_response(request)
+        if response is not None and not self._is_stale(response):
+            # hit, return cached response
+            request._cache_update_cache = False
+            return response
+
+        if self.cache_stale_timeout and cache_key is not None:
+            # Only let one request at a time update the page. Pages whose
+            # cache key was never learned, e.g. because they aren't
+            # cacheable, aren't locked.
+            lock_key = '%s.lock' % cache_key
+            if self.cache.add(lock_key, True, self.lock_timeout):
+                request._cache_lock_key = lock_key
+            else:
+                if response is None:
+                    response = self._wait_for_update(request, lock_key)
+                if response is not None:
+                    request._cache_update_cache = False
+                    return response
+
+        request._cache_update_cache = True
+        return None  # No cache information available, need to rebuild.
+
+    def _get_cached_response(self, request):
+        """
+        Return a tuple of (cache_key, response) where response is the cached
+        page or None.
+        """
         # try and get the cached GET response
         cache_key = get_cache_key(request, self.key_prefix, 'GET', cache=self.cache)
         if cache_key is None:
-            request._cache_update_cache = True
-            return None  # No cache information available, need to rebuild.
+            return None, None
         response = self.cache.get(cache_key)
         # if it wasn't found and we are looking for a HEAD, try looking just for that
         if response is None and request.method == 'HEAD':
             cache_key = get_cache_key(request, self.key_prefix, 'HEAD', cache=self.cache)
             response = self.cache.get(cache_key)
+        return cache_key, response
 
-        if response is None:
-            request._cache_update_cache = True
-            return None  # No cache information available, need to rebuild.
+    def _is_stale(self, response):
+        fresh_until = getattr(response, '_cache_fresh_until', None)
+        return fresh_until is not None and fresh_until <= time.time()
 
-        # hit, return cached response
-        request._cache_update_cache = False
-        return response
+    def _wait_for_update(self, request, lock_key):
+        """
+        Wait for the request holding the lock to cache the page and return
+        it, or None if it releases the lock without caching the page or
+        doesn't cache it within lock_wait seconds.
+        """
+        deadline = time.monotonic() + self.lock_wait
+        while time.monotonic() < deadline:
+            time.sleep(self.lock_poll_interval)
+            cache_key, response = self._get_cached_response(request)
+            if response is not None:
+                return response
+            if not self.cache.has_key(lock_key):
+                break
+        return None
 
 
 class CacheMiddleware(UpdateCacheMiddleware, FetchFromCacheMiddleware):
@@ -186,4 +256,9 @@ class CacheMiddleware(UpdateCacheMiddleware, FetchFromCacheMiddleware):
         if cache_timeout is None:
             cache_timeout = settings.CACHE_MIDDLEWARE_SECONDS
         self.cache_timeout = cache_timeout
+
+        stale_timeout = kwargs.get('stale_timeout')
+        if stale_timeout is None:
+            stale_timeout = settings.CACHE_MIDDLEWARE_STALE_SECONDS
+        self.cache_stale_timeout = stale_timeout
         self.cache = caches[self.cache_alias]
@@ -54,6 +54,7 @@ import logging
 import re
 from enum import Enum
 from inspect import getcallargs, getfullargspec, unwrap
+from weakref import WeakKeyDictionary
 
 from django.template.context import (  # NOQA: imported for backwards compatibility
     BaseContext, Context, ContextPopException, RequestContext,
@@ -154,12 +155,25 @@ class Template:
         self.engine = engine
         self.source = str(template_string)  # May be lazy.
         self.nodelist = self.compile_nodelist()
+        self.render_function = self.get_render_function()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Generated functions can't be pickled, __setstate__() rebuilds it.
+        state['render_function'] = None
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.render_function = self.get_render_function()
 
     def __iter__(self):
         for node in self.nodelist:
             yield from node
 
     def _render(self, context):
+        if self.render_function is not None:
+            return self.render_function(context)
         return self.nodelist.render(context)
 
     def render(self, context):
@@ -172,6 +186,17 @@ class Template:
             else:
                 return self._render(context)
 
+    def get_render_function(self):
+        """
+        Return a Python function rendering the nodelist if the engine compiles
+        templates, or None to render by walking the nodes.
+        """
+        # Compiled templates don't annotate exceptions with debug information.
+        if getattr(self.engine, 'compile_templates', False) and not self.engine.debug:
+            from .codegen import compile_template
+            return compile_template(self)
+        return None
+
     def compile_nodelist(self):
         """
         Parse and compile the template source into a nodelist. If debug
@@ -724,6 +749,28 @@ class FilterExpression:
         return self.token
 
 
+def attribute_lookup(obj, bit):
+    """
+    Look bit up as an attribute of obj, whose type doesn't support item
+    lookups, so that an attribute lookup is the only one that can succeed.
+    """
+    try:
+        return getattr(obj, bit)
+    except (TypeError, AttributeError):
+        # Reraise if the exception was raised by a @property
+        if bit in dir(obj):
+            raise
+    raise VariableDoesNotExist("Failed lookup for key [%s] in %r", (bit, obj))
+
+
+def index_lookup(obj, bit):
+    """Look bit up as an index of obj, a list or a tuple."""
+    try:
+        return obj[int(bit)]
+    except IndexError:
+        raise VariableDoesNotExist("Failed lookup for key [%s] in %r", (bit, obj))
+
+
 class Variable:
     """
     A template variable, resolvable against a given context. The variable may
@@ -749,6 +796,10 @@ class Variable:
         self.lookups = None
         self.translate = False
         self.message_context = None
+        # Maps types to {bit: lookup} dicts of the lookups that succeeded for
+        # them. Types are weakly referenced so that the cache doesn't keep
+        # dynamically created classes alive.
+        self.lookup_strategies = WeakKeyDictionary()
 
         if not isinstance(var, str):
             raise TypeError(
@@ -807,6 +858,16 @@ class Variable:
                 return gettext_lazy(msgid)
         return value
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # Weak references can't be pickled, __setstate__() starts afresh.
+        del state['lookup_strategies']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.lookup_strategies = WeakKeyDictionary()
+
     def __repr__(self):
         return "<%s: %r>" % (self.__class__.__name__, self.var)
 
@@ -823,31 +884,17 @@ class Variable:
         instead.
         """
         current = context
+        strategies = self.lookup_strategies
         try:  # catch-all for silent variable failures
             for bit in self.lookups:
-                try:  # dictionary lookup
-                    current = current[bit]
-                    # ValueError/IndexError are for numpy.array lookup on
-                    # numpy < 1.9 and 1.9+ respectively
-                except (TypeError, AttributeError, KeyError, ValueError, IndexError):
-                    try:  # attribute lookup
-                        # Don't return class attributes if the class is the context:
-                        if isinstance(current, BaseContext) and getattr(type(current), bit):
-                            raise AttributeError
-                        current = getattr(current, bit)
-                    except (TypeError, AttributeError):
-                        # Reraise if the exception was raised by a @property
-                        if not isinstance(current, BaseContext) and bit in dir(current):
-                            raise
-                        try:  # list-index lookup
-                            current = current[int(bit)]
-                        except (IndexError,  # list index out of range
-                                ValueError,  # invalid literal for int()
-                                KeyError,    # current is a dict without `int(bit)` key
-                                TypeError):  # unsubscriptable object
-                            raise VariableDoesNotExist("Failed lookup for key "
-                                                       "[%s] in %r",
-                                                       (bit, current))  # missing attribute
+                type_strategies = strategies.get(type(current))
+                lookup = type_strategies.get(bit) if type_strategies else None
+                if lookup is not None:
+                    # The remembered lookup is the only one that can succeed,
+                    # so it fails the same way as trying each kind would.
+                    current = lookup(current, bit)
+                else:
+                    current = self._lookup_bit(current, bit, strategies)
                 if callable(current):
                     if getattr(current, 'do_not_call_in_templates', False):
                         pass
@@ -879,6 +926,48 @@ class Variable:
 
         return current
 
+    def _lookup_bit(self, current, bit, strategies):
+        """
+        Look bit up in current, trying a dictionary lookup, an attribute
+        lookup, and a list-index lookup in turn. Remember the lookup that
+        succeeded in strategies when it's the only one that can succeed for
+        objects of that exact type.
+        """
+        cls = type(current)
+        try:  # dictionary lookup
+            return current[bit]
+        # ValueError/IndexError are for numpy.array lookup on
+        # numpy < 1.9 and 1.9+ respectively
+        except (TypeError, AttributeError, KeyError, ValueError, IndexError):
+            pass
+        try:  # attribute lookup
+            # Don't return class attributes if the class is the context:
+            if isinstance(current, BaseContext) and getattr(type(current), bit):
+                raise AttributeError
+            current = getattr(current, bit)
+        except (TypeError, AttributeError):
+            # Reraise if the exception was raised by a @property
+            if not isinstance(current, BaseContext) and bit in dir(current):
+                raise
+        else:
+            # Dictionary lookups always fail on objects without __getitem__().
+            if not hasattr(cls, '__getitem__'):
+                strategies.setdefault(cls, {})[bit] = attribute_lookup
+            return current
+        try:  # list-index lookup
+            current = current[int(bit)]
+        except (IndexError,  # list index out of range
+                ValueError,  # invalid literal for int()
+                KeyError,    # current is a dict without `int(bit)` key
+                TypeError):  # unsubscriptable object
+            raise VariableDoesNotExist("Failed lookup for key "
+                                       "[%s] in %r",
+                                       (bit, current))  # missing attribute
+        # Lists and tuples don't have attributes named after integers.
+        if cls in (list, tuple):
+            strategies.setdefault(cls, {})[bit] = index_lookup
+        return current
+
 
 class Node:
     # Set this to True for nodes that must be first in the template (although
@@ -0,0 +1,233 @@
+"""
+Compile a parsed template into a Python function.
+
+Engine(compile_templates=True) makes Template render through a function
+generated from its nodelist instead of walking the nodes. Text, variables with
+their filters, and the {% for %}, {% if %} and {% with %} tags become inline
+code; any other node is rendered by calling its render_annotated() method, so
+custom tags keep working unchanged.
+"""
+from django.utils.html import conditional_escape
+from django.utils.safestring import SafeData, mark_safe
+from django.utils.timezone import template_localtime
+
+from .base import (
+    TextNode, Variable, VariableDoesNotExist, VariableNode,
+    render_value_in_context,
+)
+from .defaulttags import ForNode, IfNode, WithNode
+
+
+def eval_condition(condition, context):
+    """Evaluate an {% if %} condition the way IfNode.render() does."""
+    try:
+        return condition.eval(context)
+    except VariableDoesNotExist:
+        return None
+
+
+def render_variable(resolve, context):
+    """Render the value of a variable the way VariableNode.render() does."""
+    try:
+        output = resolve(context)
+    except UnicodeDecodeError:
+        return ''
+    if isinstance(output, str):
+        # Strings are neither localized nor converted to local time.
+        return conditional_escape(output) if context.autoescape else str(output)
+    return render_value_in_context(output, context)
+
+
+class TemplateCodeGenerator:
+    """
+    Generate the source of a render(context) function for a nodelist. The
+    objects the code refers to (nodes, variables, filters) are collected in
+    a namespace the source is executed in.
+    """
+    def __init__(self):
+        # Source lines of the render() function and of the helper functions
+        # it calls.
+        self.lines = []
+        self.helper_lines = []
+        self.namespace = {
+            'SafeData': SafeData,
+            'VariableDoesNotExist': VariableDoesNotExist,
+            'eval_condition': eval_condition,
+            'mark_safe': mark_safe,
+            'render_variable': render_variable,
+            'template_localtime': template_localtime,
+        }
+        self.counter = 0
+
+    def name(self, prefix, value):
+        """Return a unique name bound to value in the namespace."""
+        self.counter += 1
+        name = '%s_%d' % (prefix, self.counter)
+        self.namespace[name] = value
+        return name
+
+    def write(self, indent, line):
+        self.lines.append('    ' * indent + line)
+
+    def write_helper(self, indent, line):
+        self.helper_lines.append('    ' * indent + line)
+
+    def compile(self, nodelist):
+        self.write(0, 'def render(context):')
+        self.write(1, 'result = []')
+        self.write(1, 'append = result.append')
+        self.write_nodelist(1, nodelist)
+        self.write(1, "return mark_safe(''.join(result))")
+        source = '\n'.join(self.helper_lines + self.lines)
+        exec(compile(source, '<compiled template>', 'exec'), self.namespace)
+        return self.namespace['render']
+
+    def write_nodelist(self, indent, nodelist):
+        for node in nodelist:
+            self.write_node(indent, node)
+
+    def write_node(self, indent, node):
+        # Exact type checks, since subclasses may change how nodes render.
+        node_type = type(node)
+        if node_type is TextNode:
+            self.write(indent, 'append(%r)' % node.s)
+        elif node_type is VariableNode:
+            resolve = self.write_filter_expression(node.filter_expression)
+            self.write(indent, 'append(render_variable(%s, context))' % resolve)
+        elif node_type is ForNode:
+            self.write_for(indent, node)
+        elif node_type is IfNode:
+            self.write_if(indent, node)
+        elif node_type is WithNode:
+            self.write_with(indent, node)
+        else:
+            self.write(indent, 'append(str(%s.render_annotated(context)))' % self.name('node', node))
+
+    def write_filter_expression(self, filter_expression):
+        """
+        Write a helper function equivalent to filter_expression.resolve()
+        with the filter chain unrolled, and return its name.
+        """
+        self.counter += 1
+        name = 'resolve_%d' % self.counter
+        write = self.write_helper
+        var = filter_expression.var
+        write(0, 'def %s(context):' % name)
+        if isinstance(var, Variable):
+            var_name = self.name('var', var)
+            if var.lookups is not None and not var.translate:
+                lookup = '%s._resolve_lookup(context)' % var_name
+            else:
+                lookup = '%s.resolve(context)' % var_name
+            write(1, 'try:')
+            write(2, 'obj = %s' % lookup)
+            write(1, 'except VariableDoesNotExist:')
+            write(2, 'string_if_invalid = context.template.engine.string_if_invalid')
+            write(2, 'if string_if_invalid:')
+            write(3, "if '%s' in string_if_invalid:")
+            write(4, 'return string_if_invalid %% %s' % var_name)
+            write(3, 'return string_if_invalid')
+            write(2, 'obj = string_if_invalid')
+        else:
+            write(1, 'obj = %s' % self.name('const', var))
+        for func, args in filter_expression.filters:
+            arg_vals = []
+            for lookup, arg in args:
+                if lookup:
+                    arg_vals.append('%s.resolve(context)' % self.name('arg', arg))
+                else:
+                    arg_vals.append(self.name('arg', mark_safe(arg)))
+            if getattr(func, 'needs_autoescape', False):
+                arg_vals.append('autoescape=context.autoescape')
+            if getattr(func, 'expects_localtime', False):
+                write(1, 'obj = template_localtime(obj, context.use_tz)')
+            call = '%s(%s)' % (self.name('filter', func), ', '.join(['obj'] + arg_vals))
+            if getattr(func, 'is_safe', False):
+                write(1, 'new_obj = %s' % call)
+                write(1, 'obj = mark_safe(new_obj) if isinstance(obj, SafeData) else new_obj')
+            else:
+                write(1, 'obj = %s' % call)
+        write(1, 'return obj')
+        write(0, '')
+        return name
+
+    def write_for(self, indent, node):
+        n = self.counter + 1
+        self.counter = n
+        sequence = self.name('sequence', node.sequence)
+        values, loop_dict, item = 'values_%d' % n, 'loop_dict_%d' % n, 'item_%d' % n
+        len_values, i = 'len_values_%d' % n, 'i_%d' % n
+        self.write(indent, "parentloop_%d = context['forloop'] if 'forloop' in context else {}" % n)
+        self.write(indent, 'with context.push():')
+        indent += 1
+        self.write(indent, '%s = %s.resolve(context, ignore_failures=True)' % (values, sequence))
+        self.write(indent, 'if %s is None:' % values)
+        self.write(indent + 1, '%s = []' % values)
+        self.write(indent, "if not hasattr(%s, '__len__'):" % values)
+        self.write(indent + 1, '%s = list(%s)' % (values, values))
+        self.write(indent, '%s = len(%s)' % (len_values, values))
+        self.write(indent, 'if %s < 1:' % len_values)
+        self.write(indent + 1, 'pass')
+        self.write_nodelist(indent + 1, node.nodelist_empty)
+        self.write(indent, 'else:')
+        indent += 1
+        if node.is_reversed:
+            self.write(indent, '%s = reversed(%s)' % (values, values))
+        self.write(indent, "%s = context['forloop'] = {'parentloop': parentloop_%d}" % (loop_dict, n))
+        self.write(indent, 'for %s, %s in enumerate(%s):' % (i, item, values))
+        indent += 1
+        self.write(indent, "%s['counter0'] = %s" % (loop_dict, i))
+        self.write(indent, "%s['counter'] = %s + 1" % (loop_dict, i))
+        self.write(indent, "%s['revcounter'] = %s - %s" % (loop_dict, len_values, i))
+        self.write(indent, "%s['revcounter0'] = %s - %s - 1" % (loop_dict, len_values, i))
+        self.write(indent, "%s['first'] = (%s == 0)" % (loop_dict, i))
+        self.write(indent, "%s['last'] = (%s == %s - 1)" % (loop_dict, i, len_values))
+        loopvars = self.name('loopvars', node.loopvars)
+        if len(node.loopvars) > 1:
+            self.write(indent, 'try:')
+            self.write(indent + 1, 'len_item = len(%s)' % item)
+            self.write(indent, 'except TypeError:')
+            self.write(indent + 1, 'len_item = 1')
+            self.write(indent, 'if len_item != %d:' % len(node.loopvars))
+            self.write(indent + 1, 'raise ValueError(%r.format(len_item))' % (
+                'Need %d values to unpack in for loop; got {}. ' % len(node.loopvars)
+            ))
+            self.write(indent, 'context.update(dict(zip(%s, %s)))' % (loopvars, item))
+            self.write_nodelist(indent, node.nodelist_loop)
+            self.write(indent, 'context.pop()')
+        else:
+            self.write(indent, 'context[%s[0]] = %s' % (loopvars, item))
+            self.write_nodelist(indent, node.nodelist_loop)
+
+    def write_if(self, indent, node):
+        keyword = 'if'
+        for condition, nodelist in node.conditions_nodelists:
+            if condition is None:
+                self.write(indent, 'else:')
+            else:
+                self.write(indent, '%s eval_condition(%s, context):' % (keyword, self.name('condition', condition)))
+            self.write(indent + 1, 'pass')
+            self.write_nodelist(indent + 1, nodelist)
+            keyword = 'elif'
+            if condition is None:
+                break
+
+    def write_with(self, indent, node):
+        values = ', '.join(
+            '%r: %s.resolve(context)' % (key, self.name('value', value))
+            for key, value in node.extra_context.items()
+        )
+        self.write(indent, 'with context.push(**{%s}):' % values)
+        self.write(indent + 1, 'pass')
+        self.write_nodelist(indent + 1, node.nodelist)
+
+
+def compile_template(template):
+    """
+    Return a function rendering template.nodelist in a context, or None if
+    the nodelist can't be compiled (e.g. it nests too deeply for Python).
+    """
+    try:
+        return TemplateCodeGenerator().compile(template.nodelist)
+    except (SyntaxError, RecursionError):
+        return None
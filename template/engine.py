@@ -19,7 +19,8 @@ class Engine:
 
     def __init__(self, dirs=None, app_dirs=False, context_processors=None,
                  debug=False, loaders=None, string_if_invalid='',
-                 file_charset='utf-8', libraries=None, builtins=None, autoescape=True):
+                 file_charset='utf-8', libraries=None, builtins=None, autoescape=True,
+                 compile_templates=False):
         if dirs is None:
             dirs = []
         if context_processors is None:
@@ -42,6 +43,7 @@ class Engine:
         self.dirs = dirs
         self.app_dirs = app_dirs
         self.autoescape = autoescape
+        self.compile_templates = compile_templates
         self.context_processors = context_processors
         self.debug = debug
         self.loaders = loaders
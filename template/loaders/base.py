@@ -26,12 +26,14 @@ class Loader:
                 tried.append((origin, 'Source does not exist'))
                 continue
             else:
-                return Template(
-                    contents, origin, origin.template_name, self.engine,
-                )
+                return self.get_template_from_contents(contents, origin)
 
         raise TemplateDoesNotExist(template_name, tried=tried)
 
+    def get_template_from_contents(self, contents, origin):
+        """Return a Template compiled from the contents of origin."""
+        return Template(contents, origin, origin.template_name, self.engine)
+
     def get_template_sources(self, template_name):
         """
         An iterator that yields possible matching template paths for a
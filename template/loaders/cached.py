@@ -4,24 +4,129 @@ to load templates from them in order, caching the result.
 """
 
 import hashlib
+import os
+import pickle
+import tempfile
 
+from django.core.files.move import file_move_safe
 from django.template import TemplateDoesNotExist
 from django.template.backends.django import copy_exception
+from django.template.smartif import OPERATORS
+from django.utils.version import get_version
 
 from .base import Loader as BaseLoader
 
 
+class TemplatePickler(pickle.Pickler):
+    """
+    Pickle a Template, storing references to its engine and origin, and to
+    the {% if %} operator classes, which can't be pickled by name.
+    """
+    def __init__(self, file, template):
+        super().__init__(file, pickle.HIGHEST_PROTOCOL)
+        self.template = template
+
+    def persistent_id(self, obj):
+        if obj is self.template.engine:
+            return 'engine'
+        if obj is self.template.origin:
+            return 'origin'
+        if isinstance(obj, type) and OPERATORS.get(getattr(obj, 'id', None)) is obj:
+            return ('operator', obj.id)
+        return None
+
+
+class TemplateUnpickler(pickle.Unpickler):
+    def __init__(self, file, engine, origin):
+        super().__init__(file)
+        self.engine = engine
+        self.origin = origin
+
+    def persistent_load(self, pid):
+        if pid == 'engine':
+            return self.engine
+        if pid == 'origin':
+            return self.origin
+        if isinstance(pid, tuple) and pid[0] == 'operator':
+            return OPERATORS[pid[1]]
+        raise pickle.UnpicklingError('Unsupported persistent id: %r' % (pid,))
+
+
 class Loader(BaseLoader):
+    template_cache_suffix = '.djtemplate'
 
-    def __init__(self, engine, loaders):
+    def __init__(self, engine, loaders, cache_dir=None):
         self.template_cache = {}
         self.get_template_cache = {}
         self.loaders = engine.get_template_loaders(loaders)
+        # Directory where parsed templates are persisted across processes.
+        self.cache_dir = os.path.abspath(cache_dir) if cache_dir else None
         super().__init__(engine)
 
     def get_contents(self, origin):
         return origin.loader.get_contents(origin)
 
+    def get_template_from_contents(self, contents, origin):
+        """
+        If a cache directory is set, load the parsed template from it instead
+        of parsing contents again, or store it there after parsing.
+        """
+        if self.cache_dir is None:
+            return super().get_template_from_contents(contents, origin)
+        path = self.template_cache_path(contents, origin)
+        try:
+            with open(path, 'rb') as f:
+                template = TemplateUnpickler(f, self.engine, origin).load()
+        except Exception:
+            # The file may be missing, corrupted, or refer to code that has
+            # changed since it was written. Parse the template to replace it.
+            pass
+        else:
+            template.source = contents
+            return template
+        template = super().get_template_from_contents(contents, origin)
+        self.save_template(template, path)
+        return template
+
+    def template_cache_path(self, contents, origin):
+        """
+        Return the path of the file storing the parsed template. Since parsing
+        depends on the engine's libraries and debug mode, they're part of the
+        key, along with the origin and a hash of its contents.
+        """
+        key = '\0'.join([
+            get_version(), str(self.engine.debug), repr(self.engine.builtins),
+            repr(sorted(self.engine.libraries.items())), origin.name, contents,
+        ])
+        return os.path.join(
+            self.cache_dir,
+            hashlib.sha1(key.encode()).hexdigest() + self.template_cache_suffix,
+        )
+
+    def save_template(self, template, path):
+        """
+        Write the pickled template to path, unless it contains something that
+        can't be pickled (e.g. a lambda stored by a custom tag) or the cache
+        directory isn't writable. The template is still cached in memory.
+        """
+        tmp_path = None
+        renamed = False
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir)
+            with open(fd, 'wb') as f:
+                TemplatePickler(f, template).dump(template)
+            file_move_safe(tmp_path, path, allow_overwrite=True)
+            renamed = True
+        except (OSError, pickle.PicklingError, AttributeError, TypeError, RecursionError):
+            pass
+        finally:
+            if tmp_path is not None and not renamed:
+                try:
+                    os.remove(tmp_path)
+                except OSError:
+                    pass
+
     def get_template(self, template_name, skip=None):
         """
         Perform the caching that gives this loader its name. Often many of the
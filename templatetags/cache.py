@@ -1,8 +1,11 @@
+import re
+
 from django.core.cache import InvalidCacheBackendError, caches
 from django.core.cache.utils import make_template_fragment_key
 from django.template import (
     Library, Node, TemplateSyntaxError, VariableDoesNotExist,
 )
+from django.utils.safestring import mark_safe
 
 register = Library()
 
@@ -15,7 +18,7 @@ class CacheNode(Node):
         self.vary_on = vary_on
         self.cache_name = cache_name
 
-    def render(self, context):
+    def get_expire_time(self, context):
         try:
             expire_time = self.expire_time_var.resolve(context)
         except VariableDoesNotExist:
@@ -25,23 +28,31 @@ class CacheNode(Node):
                 expire_time = int(expire_time)
             except (ValueError, TypeError):
                 raise TemplateSyntaxError('"cache" tag got a non-integer timeout value: %r' % expire_time)
+        return expire_time
+
+    def get_fragment_cache(self, context):
         if self.cache_name:
             try:
                 cache_name = self.cache_name.resolve(context)
             except VariableDoesNotExist:
                 raise TemplateSyntaxError('"cache" tag got an unknown variable: %r' % self.cache_name.var)
             try:
-                fragment_cache = caches[cache_name]
+                return caches[cache_name]
             except InvalidCacheBackendError:
                 raise TemplateSyntaxError('Invalid cache name specified for cache tag: %r' % cache_name)
-        else:
-            try:
-                fragment_cache = caches['template_fragments']
-            except InvalidCacheBackendError:
-                fragment_cache = caches['default']
+        try:
+            return caches['template_fragments']
+        except InvalidCacheBackendError:
+            return caches['default']
 
+    def get_cache_key(self, context):
         vary_on = [var.resolve(context) for var in self.vary_on]
-        cache_key = make_template_fragment_key(self.fragment_name, vary_on)
+        return make_template_fragment_key(self.fragment_name, vary_on)
+
+    def render(self, context):
+        expire_time = self.get_expire_time(context)
+        fragment_cache = self.get_fragment_cache(context)
+        cache_key = self.get_cache_key(context)
         value = fragment_cache.get(cache_key)
         if value is None:
             value = self.nodelist.render(context)
@@ -49,6 +60,86 @@ class CacheNode(Node):
         return value
 
 
+class CacheForNode(CacheNode):
+    """
+    Render a cached fragment for each item of a sequence, fetching all the
+    fragments with one get_many() and storing the missing ones with one
+    set_many().
+    """
+    def __init__(self, nodelist, expire_time_var, fragment_name, vary_on, cache_name, loopvars, sequence):
+        super().__init__(nodelist, expire_time_var, fragment_name, vary_on, cache_name)
+        self.loopvars = loopvars
+        self.sequence = sequence
+
+    def push_loopvars(self, context, item):
+        """
+        Set the loop variables for item in the context, as {% for %} does.
+        Return True if a context was pushed.
+        """
+        num_loopvars = len(self.loopvars)
+        if num_loopvars == 1:
+            context[self.loopvars[0]] = item
+            return False
+        try:
+            len_item = len(item)
+        except TypeError:  # not an iterable
+            len_item = 1
+        if num_loopvars != len_item:
+            raise ValueError(
+                "Need {} values to unpack in for loop; got {}. "
+                .format(num_loopvars, len_item),
+            )
+        context.update(dict(zip(self.loopvars, item)))
+        return True
+
+    def update_forloop(self, loop_dict, i, len_values):
+        """Set the {% for %} loop attributes of the i-th item in loop_dict."""
+        loop_dict['counter0'] = i
+        loop_dict['counter'] = i + 1
+        loop_dict['revcounter'] = len_values - i
+        loop_dict['revcounter0'] = len_values - i - 1
+        loop_dict['first'] = (i == 0)
+        loop_dict['last'] = (i == len_values - 1)
+
+    def render(self, context):
+        expire_time = self.get_expire_time(context)
+        fragment_cache = self.get_fragment_cache(context)
+        parentloop = context['forloop'] if 'forloop' in context else {}
+        with context.push():
+            values = self.sequence.resolve(context, ignore_failures=True)
+            if values is None:
+                values = []
+            if not hasattr(values, '__len__'):
+                values = list(values)
+            len_values = len(values)
+            loop_dict = context['forloop'] = {'parentloop': parentloop}
+            # Compute the keys of all fragments before fetching them at once.
+            cache_keys = []
+            for i, item in enumerate(values):
+                self.update_forloop(loop_dict, i, len_values)
+                pushed = self.push_loopvars(context, item)
+                cache_keys.append(self.get_cache_key(context))
+                if pushed:
+                    context.pop()
+            cached = fragment_cache.get_many(cache_keys) if cache_keys else {}
+            missing = {}
+            result = []
+            for i, (item, cache_key) in enumerate(zip(values, cache_keys)):
+                value = cached.get(cache_key)
+                if value is None:
+                    value = missing.get(cache_key)
+                if value is None:
+                    self.update_forloop(loop_dict, i, len_values)
+                    pushed = self.push_loopvars(context, item)
+                    value = missing[cache_key] = self.nodelist.render(context)
+                    if pushed:
+                        context.pop()
+                result.append(value)
+        if missing:
+            fragment_cache.set_many(missing, expire_time)
+        return mark_safe(''.join(result))
+
+
 @register.tag('cache')
 def do_cache(parser, token):
     """
@@ -91,3 +182,57 @@ def do_cache(parser, token):
         [parser.compile_filter(t) for t in tokens[3:]],
         cache_name,
     )
+
+
+@register.tag('cachefor')
+def do_cachefor(parser, token):
+    """
+    Like a {% cache %} tag inside a {% for %} loop, but fetch the fragments
+    of all the items with one query to the cache and store the missing ones
+    with another, instead of one or two queries per item.
+
+    Usage::
+
+        {% load cache %}
+        {% cachefor [expire_time] [fragment_name] [loopvar] in [sequence] [var1] [var2] .. %}
+            .. some expensive processing of loopvar ..
+        {% endcachefor %}
+
+    The vary-on variables are resolved with the loop variables set, and the
+    fragments share their cache keys with the equivalent {% cache %} tag. As
+    with {% for %}, items may be unpacked (``{% cachefor 500 row key, value
+    in items key %}``) and a ``forloop`` variable is set for each item. A
+    cached fragment is used as is, so it shouldn't depend on ``forloop``
+    unless it also varies on it, e.g. on ``forloop.counter``.
+
+    Optionally the cache to use may be specified thus::
+
+        {% cachefor ....  using="cachename" %}
+    """
+    nodelist = parser.parse(('endcachefor',))
+    parser.delete_first_token()
+    tokens = token.split_contents()
+    if len(tokens) > 4 and tokens[-1].startswith('using='):
+        cache_name = parser.compile_filter(tokens[-1][len('using='):])
+        tokens = tokens[:-1]
+    else:
+        cache_name = None
+    try:
+        in_index = tokens.index('in', 4)
+    except ValueError:
+        in_index = None
+    if in_index is None or in_index == len(tokens) - 1:
+        raise TemplateSyntaxError(
+            "'%s' tag requires arguments in the format: [expire_time] "
+            "[fragment_name] [loopvar] in [sequence] [var1] .." % tokens[0]
+        )
+    loopvars = re.split(r' *, *', ' '.join(tokens[3:in_index]))
+    for var in loopvars:
+        if not var or ' ' in var:
+            raise TemplateSyntaxError("'%s' tag received an invalid argument: %s" % (tokens[0], token.contents))
+    return CacheForNode(
+        nodelist, parser.compile_filter(tokens[1]),
+        tokens[2],  # fragment_name can't be a variable.
+        [parser.compile_filter(t) for t in tokens[in_index + 2:]],
+        cache_name, loopvars, parser.compile_filter(tokens[in_index + 1]),
+    )
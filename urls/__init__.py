@@ -1,7 +1,7 @@
 from .base import (
     clear_script_prefix, clear_url_caches, get_script_prefix, get_urlconf,
-    is_valid_path, resolve, reverse, reverse_lazy, set_script_prefix,
-    set_urlconf, translate_url,
+    is_valid_path, resolve, reverse, reverse_cache_info, reverse_lazy,
+    set_script_prefix, set_urlconf, translate_url,
 )
 from .conf import include, path, re_path
 from .converters import register_converter
@@ -18,6 +18,6 @@ __all__ = [
     'clear_url_caches', 'get_callable', 'get_mod_func', 'get_ns_resolver',
     'get_resolver', 'get_script_prefix', 'get_urlconf', 'include',
     'is_valid_path', 'path', 're_path', 'register_converter', 'resolve',
-    'reverse', 'reverse_lazy', 'set_script_prefix', 'set_urlconf',
-    'translate_url',
+    'reverse', 'reverse_cache_info', 'reverse_lazy', 'set_script_prefix',
+    'set_urlconf', 'translate_url',
 ]
@@ -1,9 +1,11 @@
+import functools
+import uuid
 from threading import local
 from urllib.parse import urlsplit, urlunsplit
 
 from django.utils.encoding import iri_to_uri
 from django.utils.functional import lazy
-from django.utils.translation import override
+from django.utils.translation import get_language, override
 
 from .exceptions import NoReverseMatch, Resolver404
 from .resolvers import get_ns_resolver, get_resolver
@@ -17,6 +19,10 @@ _prefixes = local()
 # Overridden URLconfs for each thread are stored here.
 _urlconfs = local()
 
+# Types of args and kwargs values whose text representation is fully
+# determined by their value, making reverse() results safe to cache.
+_REVERSE_CACHEABLE_TYPES = {str, int, uuid.UUID}
+
 
 def resolve(path, urlconf=None):
     if urlconf is None:
@@ -27,12 +33,35 @@ def resolve(path, urlconf=None):
 def reverse(viewname, urlconf=None, args=None, kwargs=None, current_app=None):
     if urlconf is None:
         urlconf = get_urlconf()
-    resolver = get_resolver(urlconf)
     args = args or []
     kwargs = kwargs or {}
 
     prefix = get_script_prefix()
 
+    if (isinstance(viewname, str) and
+            all(type(arg) in _REVERSE_CACHEABLE_TYPES for arg in args) and
+            all(type(value) in _REVERSE_CACHEABLE_TYPES for value in kwargs.values())):
+        # The active language selects the resolver's reverse_dict.
+        return _cached_reverse(
+            viewname, urlconf, tuple(args), tuple(sorted(kwargs.items())),
+            current_app, prefix, get_language(),
+        )
+    return _reverse(viewname, urlconf, args, kwargs, current_app, prefix)
+
+
+def reverse_cache_info():
+    """Return the hits, misses and size of the reverse() cache."""
+    return _cached_reverse.cache_info()
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_reverse(viewname, urlconf, args, kwargs, current_app, prefix, language):
+    return _reverse(viewname, urlconf, args, dict(kwargs), current_app, prefix)
+
+
+def _reverse(viewname, urlconf, args, kwargs, current_app, prefix):
+    resolver = get_resolver(urlconf)
+
     if not isinstance(viewname, str):
         view = viewname
     else:
@@ -97,6 +126,7 @@ def clear_url_caches():
     get_callable.cache_clear()
     get_resolver.cache_clear()
     get_ns_resolver.cache_clear()
+    _cached_reverse.cache_clear()
 
 
 def set_script_prefix(prefix):
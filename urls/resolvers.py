@@ -360,6 +360,50 @@ class URLPattern:
         return callback.__module__ + "." + callback.__qualname__
 
 
+def get_route_prefix(pattern):
+    """
+    Return the literal text that a path must start with to match the given
+    pattern, or '' if it can't be known without running the pattern's regex
+    (RegexPattern, LocalePrefixPattern and translated routes).
+    """
+    if type(pattern) is not RoutePattern or not isinstance(pattern._route, str):
+        return ''
+    match = _PATH_PARAMETER_COMPONENT_RE.search(pattern._route)
+    return pattern._route[:match.start()] if match else pattern._route
+
+
+class RoutePrefixTrie:
+    """
+    A character trie of the url_patterns of a URLResolver keyed on the
+    literal prefix of their route. It finds the patterns that may match a
+    path without trying the regex of every pattern.
+    """
+    def __init__(self, url_patterns):
+        # Each node is a (children, entries) tuple where entries is a list of
+        # (position in url_patterns, pattern) whose prefix ends at the node.
+        self.root = ({}, [])
+        for index, url_pattern in enumerate(url_patterns):
+            node = self.root
+            for char in get_route_prefix(url_pattern.pattern):
+                node = node[0].setdefault(char, ({}, []))
+            node[1].append((index, url_pattern))
+
+    def candidates(self, path):
+        """
+        Return the (index, pattern) pairs whose prefix starts path, in
+        url_patterns order.
+        """
+        node = self.root
+        entries = list(node[1])
+        for char in path:
+            node = node[0].get(char)
+            if node is None:
+                break
+            entries.extend(node[1])
+        entries.sort(key=lambda entry: entry[0])
+        return entries
+
+
 class URLResolver:
     def __init__(self, pattern, urlconf_name, default_kwargs=None, app_name=None, namespace=None):
         self.pattern = pattern
@@ -488,15 +532,16 @@ class URLResolver:
         match = self.pattern.match(path)
         if match:
             new_path, args, kwargs = match
-            for pattern in self.url_patterns:
+            # Map the position of each pattern tried to the tried list it
+            # contributes, so that the full list can be rebuilt in order.
+            tried_by_index = {}
+            for index, pattern in self.route_prefix_trie.candidates(new_path):
                 try:
                     sub_match = pattern.resolve(new_path)
                 except Resolver404 as e:
                     sub_tried = e.args[0].get('tried')
                     if sub_tried is not None:
-                        tried.extend([pattern] + t for t in sub_tried)
-                    else:
-                        tried.append([pattern])
+                        tried_by_index[index] = [[pattern] + t for t in sub_tried]
                 else:
                     if sub_match:
                         # Merge captured arguments in match with submatch
@@ -516,7 +561,9 @@ class URLResolver:
                             [self.app_name] + sub_match.app_names,
                             [self.namespace] + sub_match.namespaces,
                         )
-                    tried.append([pattern])
+            # Patterns that weren't candidates couldn't match either.
+            for index, pattern in enumerate(self.url_patterns):
+                tried.extend(tried_by_index.get(index, [[pattern]]))
             raise Resolver404({'tried': tried, 'path': new_path})
         raise Resolver404({'path': path})
 
@@ -542,6 +589,10 @@ class URLResolver:
             raise ImproperlyConfigured(msg.format(name=self.urlconf_name))
         return patterns
 
+    @cached_property
+    def route_prefix_trie(self):
+        return RoutePrefixTrie(self.url_patterns)
+
     def resolve_error_handler(self, view_type):
         callback = getattr(self.urlconf_module, 'handler%s' % view_type, None)
         if not callback:
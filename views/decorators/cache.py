@@ -5,7 +5,7 @@ from django.utils.cache import add_never_cache_headers, patch_cache_control
 from django.utils.decorators import decorator_from_middleware_with_args
 
 
-def cache_page(timeout, *, cache=None, key_prefix=None):
+def cache_page(timeout, *, cache=None, key_prefix=None, stale_timeout=None):
     """
     Decorator for views that tries getting the page from the cache and
     populates the cache if the page isn't in the cache yet.
@@ -18,9 +18,14 @@ def cache_page(timeout, *, cache=None, key_prefix=None):
 
     Additionally, all headers from the response's Vary header will be taken
     into account on caching -- just like the middleware does.
+
+    If stale_timeout is given (it defaults to CACHE_MIDDLEWARE_STALE_SECONDS),
+    the page is kept that many more seconds in the cache and served to
+    concurrent requests while a single one updates it.
     """
     return decorator_from_middleware_with_args(CacheMiddleware)(
-        cache_timeout=timeout, cache_alias=cache, key_prefix=key_prefix
+        cache_timeout=timeout, cache_alias=cache, key_prefix=key_prefix,
+        stale_timeout=stale_timeout,
     )
 
 
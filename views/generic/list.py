@@ -1,5 +1,5 @@
 from django.core.exceptions import ImproperlyConfigured
-from django.core.paginator import InvalidPage, Paginator
+from django.core.paginator import CursorPaginator, InvalidPage, Paginator
 from django.db.models.query import QuerySet
 from django.http import Http404
 from django.utils.translation import gettext as _
@@ -57,6 +57,14 @@ class MultipleObjectMixin(ContextMixin):
             queryset, page_size, orphans=self.get_paginate_orphans(),
             allow_empty_first_page=self.get_allow_empty())
         page_kwarg = self.page_kwarg
+        if isinstance(paginator, CursorPaginator):
+            # The page is identified by a cursor instead of a number.
+            cursor = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg)
+            try:
+                page = paginator.page(cursor)
+            except InvalidPage as e:
+                raise Http404(_('Invalid page: %(message)s') % {'message': str(e)})
+            return (paginator, page, page.object_list, page.has_other_pages())
         page = self.kwargs.get(page_kwarg) or self.request.GET.get(page_kwarg) or 1
         try:
             page_number = int(page)